@@ -37,13 +37,30 @@ import json
 import csv
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 # Exit codes
 EXIT_CODE_SUCCESS = 0
 EXIT_CODE_ERROR = 1
 EXIT_CODE_INTERRUPT = 130  # Standard exit code for SIGINT
 
+# Color codes for terminal output
+COLORS = {
+    'red': '\033[91m',
+    'green': '\033[92m',
+    'yellow': '\033[93m',
+    'blue': '\033[94m',
+    'magenta': '\033[95m',
+    'cyan': '\033[96m',
+    'reset': '\033[0m',
+    'bold': '\033[1m'
+}
+
+# Precomputed (prefix, suffix) pairs used by StarlinkCLI.colorize
+_COLOR_WRAPPERS: Dict[str, Tuple[str, str]] = {
+    name: (code, COLORS['reset']) for name, code in COLORS.items()
+}
+
 # Ensure proper import path when running as a script
 if __name__ == "__main__":
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -78,22 +95,12 @@ class StarlinkCLI:
             raise
         
         # Color codes for terminal output
-        self.colors = {
-            'red': '\033[91m',
-            'green': '\033[92m',
-            'yellow': '\033[93m',
-            'blue': '\033[94m',
-            'magenta': '\033[95m',
-            'cyan': '\033[96m',
-            'reset': '\033[0m',
-            'bold': '\033[1m'
-        }
+        self.colors = dict(COLORS)
     
     def colorize(self, text: str, color: str) -> str:
         """Add color to text for terminal output"""
-        if color in self.colors:
-            return f"{self.colors[color]}{text}{self.colors['reset']}"
-        return text
+        pfx, sfx = _COLOR_WRAPPERS.get(color, ("", ""))
+        return f"{pfx}{text}{sfx}" if pfx else text
     
     def print_header(self, title: str):
         """Print formatted header"""
@@ -91,7 +91,7 @@ def medical_emergency_example():
     for conn_id, allocation in all_allocations.items():
         print(f"  {conn_id:25} | {allocation.allocated_bandwidth:6.1f} Mbps | Priority: {allocation.priority}")
     print("-" * 70)
-    print(f"Total Allocated: {sum(a.allocated_bandwidth for a in all_allocations.values()):.1f} Mbps")
+    print(f"Total Allocated: {optimizer.get_allocated_bandwidth():.1f} Mbps")
     print(f"Available: {optimizer.get_available_bandwidth():.1f} Mbps")
     print()
     
@@ -320,9 +320,16 @@ class ConnectivityDiagnostics:
 
         # Store in history
         self.diagnostic_history.append(diagnostic)
+        self._enforce_history_limit()
 
         return diagnostic
 
+    def _enforce_history_limit(self):
+        """Drop the oldest diagnostics beyond max_history"""
+        excess = len(self.diagnostic_history) - self.max_history
+        if excess > 0:
+            del self.diagnostic_history[:excess]
+
     def _test_signal(self) -> Dict:
         """Test signal strength"""
         # Simulate signal test
@@ -413,8 +420,7 @@ class ConnectivityDiagnostics:
         self.diagnostic_history.append(diagnostic)
 
         # Keep history within limit
-        if len(self.diagnostic_history) > self.max_history:
-            self.diagnostic_history = self.diagnostic_history[-self.max_history :]
+        self._enforce_history_limit()
 
         return diagnostic
 
@@ -0,0 +1,165 @@
+"""Pairing heap (min-heap) with decrease-key support."""
+
+from typing import Any, Iterator, List, Optional
+
+
+class PairingHeapNode:
+    """Handle for an entry stored in a PairingHeap."""
+
+    __slots__ = ("key", "value", "child", "sibling", "prev")
+
+    def __init__(self, key: Any, value: Any):
+        self.key = key
+        self.value = value
+        self.child: Optional["PairingHeapNode"] = None
+        self.sibling: Optional["PairingHeapNode"] = None
+        # Parent when this node is the leftmost child, otherwise left sibling
+        self.prev: Optional["PairingHeapNode"] = None
+
+
+class PairingHeap:
+    """
+    Min-heap with O(1) insert and find-min, O(log n) amortized delete-min
+    and o(log n) amortized decrease-key.
+
+    Keys only need to support ``<``; ties are resolved arbitrarily, so callers
+    wanting a stable order should include a sequence number in the key.
+    """
+
+    def __init__(self):
+        """Initialize an empty heap."""
+        self._root: Optional[PairingHeapNode] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._root is not None
+
+    def __iter__(self) -> Iterator[PairingHeapNode]:
+        """Iterate over all nodes in unspecified order."""
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.sibling:
+                stack.append(node.sibling)
+            if node.child:
+                stack.append(node.child)
+
+    def insert(self, key: Any, value: Any) -> PairingHeapNode:
+        """
+        Insert a value.
+
+        Args:
+            key: Ordering key (smallest key is the minimum)
+            value: Payload stored with the key
+
+        Returns:
+            Node handle usable with decrease_key() and delete()
+        """
+        node = PairingHeapNode(key, value)
+        self._root = self._meld(self._root, node)
+        self._size += 1
+        return node
+
+    def find_min(self) -> Optional[PairingHeapNode]:
+        """Return the node with the smallest key without removing it."""
+        return self._root
+
+    def delete_min(self) -> Optional[PairingHeapNode]:
+        """Remove and return the node with the smallest key."""
+        root = self._root
+        if root is None:
+            return None
+        self._root = self._merge_pairs(root.child)
+        root.child = None
+        self._size -= 1
+        return root
+
+    def decrease_key(self, node: PairingHeapNode, key: Any):
+        """
+        Lower the key of a node already in the heap.
+
+        Raises:
+            ValueError: If the new key is greater than the current key
+        """
+        if node.key < key:
+            raise ValueError("New key is greater than current key")
+        node.key = key
+        if node is self._root:
+            return
+        self._cut(node)
+        self._root = self._meld(self._root, node)
+
+    def delete(self, node: PairingHeapNode):
+        """Remove an arbitrary node from the heap."""
+        if node is self._root:
+            self.delete_min()
+            return
+        self._cut(node)
+        subtree = self._merge_pairs(node.child)
+        node.child = None
+        self._root = self._meld(self._root, subtree)
+        self._size -= 1
+
+    def clear(self):
+        """Remove all nodes."""
+        self._root = None
+        self._size = 0
+
+    @staticmethod
+    def _meld(
+        a: Optional[PairingHeapNode], b: Optional[PairingHeapNode]
+    ) -> Optional[PairingHeapNode]:
+        """Link two detached trees, making the larger root a child of the smaller."""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if b.key < a.key:
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child:
+            a.child.prev = b
+        a.child = b
+        return a
+
+    @staticmethod
+    def _cut(node: PairingHeapNode):
+        """Detach a non-root node (with its subtree) from its parent."""
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling:
+            node.sibling.prev = node.prev
+        node.prev = None
+        node.sibling = None
+
+    def _merge_pairs(
+        self, first: Optional[PairingHeapNode]
+    ) -> Optional[PairingHeapNode]:
+        """Two-pass pairing of a sibling list into a single tree."""
+        siblings: List[PairingHeapNode] = []
+        node = first
+        while node:
+            next_node = node.sibling
+            node.prev = None
+            node.sibling = None
+            siblings.append(node)
+            node = next_node
+
+        # First pass: meld pairs left to right
+        paired = [
+            self._meld(siblings[i], siblings[i + 1] if i + 1 < len(siblings) else None)
+            for i in range(0, len(siblings), 2)
+        ]
+
+        # Second pass: meld the results right to left
+        result = None
+        for tree in reversed(paired):
+            result = self._meld(tree, result)
+        return result
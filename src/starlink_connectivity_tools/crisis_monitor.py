@@ -1,14 +1,25 @@
 """Crisis-optimized monitoring with adjustable thresholds and automatic recovery."""
 
+import json
+import time
 import numpy as np
-from typing import Dict, Any, Optional, List, Callable
-from datetime import datetime, timedelta
-from enum import Enum
-from collections import deque
+from typing import Dict, Any, Optional, List, Callable, Mapping, Tuple, Union
+from datetime import datetime
+from types import MappingProxyType
+from enum import Enum, IntEnum
 from loguru import logger
 
 from .satellite_connection_manager import SatelliteConnectionManager
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+NS_PER_HOUR = 3600 * 10**9
+
 
 class ScenarioType(Enum):
     """Pre-configured crisis scenarios."""
@@ -32,6 +43,41 @@ class IssueType(Enum):
     HARDWARE_ALERT = "hardware_alert"
 
 
+class OverallStatus(IntEnum):
+    """Overall system status, ordered by severity."""
+
+    HEALTHY = 0
+    WARNING = 1
+    DEGRADED = 2
+    CRITICAL = 3
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used when serializing the status."""
+        return self.name.lower()
+
+
+# Overall status indexed by (any critical, >2 warnings, any issue) bits
+_OVERALL_STATUS = (
+    OverallStatus.HEALTHY,
+    OverallStatus.WARNING,
+    OverallStatus.DEGRADED,
+    OverallStatus.DEGRADED,
+    OverallStatus.CRITICAL,
+    OverallStatus.CRITICAL,
+    OverallStatus.CRITICAL,
+    OverallStatus.CRITICAL,
+)
+
+
+class MonitorEvent(IntEnum):
+    """Events that monitor callbacks can be registered for."""
+
+    ISSUE_DETECTED = 0
+    ISSUE_RESOLVED = 1
+    RECOVERY_ATTEMPTED = 2
+
+
 class Issue:
     """Represents a detected issue."""
 
@@ -63,46 +109,165 @@ class Issue:
         self.resolution_action = action
 
 
+class PerformanceHistory:
+    """
+    Fixed-size ring buffer of performance samples.
+
+    Samples are stored column-wise in preallocated NumPy arrays so reports
+    aggregate with vectorized operations instead of walking per-sample dicts.
+    Timestamps are time.monotonic_ns() values, which are immune to wall-clock
+    adjustments; they are converted to wall-clock time only when exported.
+    """
+
+    # Numeric metric columns and their dtypes
+    METRIC_COLUMNS = {
+        "latency_ms": np.float64,
+        "downlink_mbps": np.float64,
+        "uplink_mbps": np.float64,
+        "snr": np.float64,
+    }
+
+    def __init__(self, maxlen: int = 1000):
+        """
+        Initialize the history buffer.
+
+        Args:
+            maxlen: Maximum number of samples kept; the oldest are overwritten
+        """
+        self.maxlen = maxlen
+        self.timestamps = np.zeros(maxlen, dtype=np.int64)
+        self.columns = {
+            name: np.zeros(maxlen, dtype=dtype)
+            for name, dtype in self.METRIC_COLUMNS.items()
+        }
+        self.obstructed = np.zeros(maxlen, dtype=bool)
+        self.issues = np.zeros(maxlen, dtype=np.int32)
+        self.connections = np.empty(maxlen, dtype=object)
+        self.states = np.empty(maxlen, dtype=object)
+        self._head = 0
+        self._count = 0
+        # Maps monotonic timestamps onto the wall clock at creation time
+        self._wall_offset_ns = time.time_ns() - time.monotonic_ns()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(
+        self, timestamp: int, connection: str, metrics: Dict[str, Any], issues: int
+    ):
+        """Record one sample, overwriting the oldest when full."""
+        i = self._head
+        self.timestamps[i] = timestamp
+        for name, column in self.columns.items():
+            column[i] = metrics.get(name, 0)
+        self.obstructed[i] = metrics.get("obstructed", False)
+        self.issues[i] = issues
+        self.connections[i] = connection
+        self.states[i] = metrics.get("state")
+        self._head = (i + 1) % self.maxlen
+        self._count = min(self._count + 1, self.maxlen)
+
+    def extend(self, samples: List[Tuple[int, str, Dict[str, Any], int]]):
+        """
+        Record a batch of samples with one store per column.
+
+        Args:
+            samples: (timestamp, connection, metrics, issues) tuples, oldest first
+        """
+        samples = samples[-self.maxlen :]
+        n = len(samples)
+        if not n:
+            return
+        timestamps, connections, metrics, issues = zip(*samples)
+        idx = (self._head + np.arange(n)) % self.maxlen
+        self.timestamps[idx] = timestamps
+        for name, column in self.columns.items():
+            column[idx] = [m.get(name, 0) for m in metrics]
+        self.obstructed[idx] = [m.get("obstructed", False) for m in metrics]
+        self.issues[idx] = issues
+        self.connections[idx] = connections
+        self.states[idx] = [m.get("state") for m in metrics]
+        self._head = (self._head + n) % self.maxlen
+        self._count = min(self._count + n, self.maxlen)
+
+    def since(self, cutoff: int) -> np.ndarray:
+        """Return buffer indices of samples newer than cutoff, oldest first."""
+        start = self._head - self._count
+        order = np.arange(start, self._head) % self.maxlen
+        return order[self.timestamps[order] > cutoff]
+
+    def to_records(self, indices: np.ndarray) -> List[Dict[str, Any]]:
+        """Materialize the given samples as JSON-friendly dicts."""
+        records = []
+        for i in indices.tolist():
+            metrics = {
+                name: float(column[i]) for name, column in self.columns.items()
+            }
+            metrics["obstructed"] = bool(self.obstructed[i])
+            metrics["state"] = self.states[i]
+            records.append(
+                {
+                    "timestamp": datetime.fromtimestamp(
+                        (int(self.timestamps[i]) + self._wall_offset_ns) / 1e9
+                    ).isoformat(),
+                    "connection": self.connections[i],
+                    "metrics": metrics,
+                    "issues": int(self.issues[i]),
+                }
+            )
+        return records
+
+
 class CrisisMonitor:
     """Crisis-optimized monitoring with automatic issue detection and recovery."""
 
-    # Threshold presets for different scenarios
+    # Read-only threshold presets for different scenarios
     SCENARIO_THRESHOLDS = {
-        ScenarioType.NORMAL: {
-            "max_latency_ms": 100,
-            "min_downlink_mbps": 20,
-            "min_uplink_mbps": 5,
-            "max_obstruction_percent": 0.05,
-            "min_snr": 7.0,
-        },
-        ScenarioType.HUMANITARIAN: {
-            "max_latency_ms": 200,
-            "min_downlink_mbps": 10,
-            "min_uplink_mbps": 2,
-            "max_obstruction_percent": 0.15,
-            "min_snr": 5.0,
-        },
-        ScenarioType.MEDICAL: {
-            "max_latency_ms": 150,
-            "min_downlink_mbps": 15,
-            "min_uplink_mbps": 5,
-            "max_obstruction_percent": 0.10,
-            "min_snr": 6.0,
-        },
-        ScenarioType.DISASTER: {
-            "max_latency_ms": 300,
-            "min_downlink_mbps": 5,
-            "min_uplink_mbps": 1,
-            "max_obstruction_percent": 0.25,
-            "min_snr": 4.0,
-        },
-        ScenarioType.CONFLICT: {
-            "max_latency_ms": 250,
-            "min_downlink_mbps": 8,
-            "min_uplink_mbps": 2,
-            "max_obstruction_percent": 0.20,
-            "min_snr": 4.5,
-        },
+        ScenarioType.NORMAL: MappingProxyType(
+            {
+                "max_latency_ms": 100,
+                "min_downlink_mbps": 20,
+                "min_uplink_mbps": 5,
+                "max_obstruction_percent": 0.05,
+                "min_snr": 7.0,
+            }
+        ),
+        ScenarioType.HUMANITARIAN: MappingProxyType(
+            {
+                "max_latency_ms": 200,
+                "min_downlink_mbps": 10,
+                "min_uplink_mbps": 2,
+                "max_obstruction_percent": 0.15,
+                "min_snr": 5.0,
+            }
+        ),
+        ScenarioType.MEDICAL: MappingProxyType(
+            {
+                "max_latency_ms": 150,
+                "min_downlink_mbps": 15,
+                "min_uplink_mbps": 5,
+                "max_obstruction_percent": 0.10,
+                "min_snr": 6.0,
+            }
+        ),
+        ScenarioType.DISASTER: MappingProxyType(
+            {
+                "max_latency_ms": 300,
+                "min_downlink_mbps": 5,
+                "min_uplink_mbps": 1,
+                "max_obstruction_percent": 0.25,
+                "min_snr": 4.0,
+            }
+        ),
+        ScenarioType.CONFLICT: MappingProxyType(
+            {
+                "max_latency_ms": 250,
+                "min_downlink_mbps": 8,
+                "min_uplink_mbps": 2,
+                "max_obstruction_percent": 0.20,
+                "min_snr": 4.5,
+            }
+        ),
     }
 
     def __init__(
@@ -119,11 +284,15 @@ class CrisisMonitor:
         """
         self.connection_manager = connection_manager
         self.scenario = scenario
-        self.thresholds = self.SCENARIO_THRESHOLDS[scenario].copy()
+        # Shared reference to the read-only preset
+        self.thresholds: Mapping[str, Any] = self.SCENARIO_THRESHOLDS[scenario]
 
         self.active_issues: List[Issue] = []
+        # Severity tallies of active_issues, kept in step with the list
+        self._critical_count = 0
+        self._warning_count = 0
         self.resolved_issues: List[Issue] = []
-        self.performance_history: deque = deque(maxlen=1000)
+        self.performance_history = PerformanceHistory(maxlen=1000)
 
         self.monitoring = False
         self.monitor_interval = 10  # seconds
@@ -132,29 +301,29 @@ class CrisisMonitor:
             3  # Number of consecutive detections before action
         )
 
-        self.callbacks: Dict[str, List[Callable]] = {
-            "issue_detected": [],
-            "issue_resolved": [],
-            "recovery_attempted": [],
-        }
+        # Indexed by MonitorEvent; tuples are rebuilt on the rare registration
+        self.callbacks: List[Tuple[Callable, ...]] = [() for _ in MonitorEvent]
 
     def set_scenario(self, scenario: ScenarioType):
         """Update monitoring scenario and thresholds."""
         self.scenario = scenario
-        self.thresholds = self.SCENARIO_THRESHOLDS[scenario].copy()
+        self.thresholds = self.SCENARIO_THRESHOLDS[scenario]
         logger.info(f"Monitoring scenario updated to: {scenario.value}")
 
     def set_custom_thresholds(self, thresholds: Dict[str, Any]):
         """Set custom monitoring thresholds."""
-        self.thresholds.update(thresholds)
+        self.thresholds = MappingProxyType({**self.thresholds, **thresholds})
         self.scenario = ScenarioType.CUSTOM
         logger.info(f"Custom thresholds applied: {thresholds}")
 
-    def register_callback(self, event: str, callback: Callable):
+    def register_callback(self, event: Union[MonitorEvent, str], callback: Callable):
         """Register a callback for monitoring events."""
-        if event in self.callbacks:
-            self.callbacks[event].append(callback)
-            logger.debug(f"Registered callback for event: {event}")
+        if isinstance(event, str):
+            event = MonitorEvent.__members__.get(event.upper())
+            if event is None:
+                return
+        self.callbacks[event] += (callback,)
+        logger.debug(f"Registered callback for event: {event.name.lower()}")
 
     def check_health(self) -> Dict[str, Any]:
         """
@@ -163,6 +332,29 @@ class CrisisMonitor:
         Returns:
             Health check results with detected issues
         """
+        return self._check_health(self.performance_history.append)
+
+    def check_health_n(self, n: int) -> Dict[str, Any]:
+        """
+        Perform n consecutive health checks, storing their samples in one batch.
+
+        Args:
+            n: Number of health checks to run
+
+        Returns:
+            Results of the last health check
+        """
+        samples: List[Tuple[int, str, Dict[str, Any], int]] = []
+        result: Dict[str, Any] = {}
+        for _ in range(n):
+            result = self._check_health(lambda *sample: samples.append(sample))
+        self.performance_history.extend(samples)
+        return result
+
+    def _check_health(
+        self, record: Callable[[int, str, Dict[str, Any], int], None]
+    ) -> Dict[str, Any]:
+        """Run one health check, passing the performance sample to record."""
         health_status = self.connection_manager.perform_health_check()
         active_conn = self.connection_manager.get_active_connection()
 
@@ -180,30 +372,34 @@ class CrisisMonitor:
                 "health": health_status,
             }
 
-        metrics = active_conn.metrics
+        # Snapshot: the connection updates its metrics dict in place
+        metrics = dict(active_conn.metrics)
+        thresholds = self.thresholds
         detected_issues = []
 
         # Check latency
-        if metrics.get("latency_ms", 0) > self.thresholds["max_latency_ms"]:
+        max_latency = thresholds["max_latency_ms"]
+        if metrics.get("latency_ms", 0) > max_latency:
             issue = Issue(
                 IssueType.HIGH_LATENCY,
                 (
                     "warning"
-                    if metrics["latency_ms"] < self.thresholds["max_latency_ms"] * 1.5
+                    if metrics["latency_ms"] < max_latency * 1.5
                     else "critical"
                 ),
-                f"High latency: {metrics['latency_ms']:.1f}ms (threshold: {self.thresholds['max_latency_ms']}ms)",
+                f"High latency: {metrics['latency_ms']:.1f}ms (threshold: {max_latency}ms)",
                 datetime.now(),
                 metrics,
             )
             detected_issues.append(issue)
 
         # Check bandwidth
-        if metrics.get("downlink_mbps", 0) < self.thresholds["min_downlink_mbps"]:
+        min_downlink = thresholds["min_downlink_mbps"]
+        if metrics.get("downlink_mbps", 0) < min_downlink:
             issue = Issue(
                 IssueType.LOW_BANDWIDTH,
                 "warning",
-                f"Low downlink: {metrics['downlink_mbps']:.1f} Mbps (threshold: {self.thresholds['min_downlink_mbps']} Mbps)",
+                f"Low downlink: {metrics['downlink_mbps']:.1f} Mbps (threshold: {min_downlink} Mbps)",
                 datetime.now(),
                 metrics,
             )
@@ -212,27 +408,28 @@ class CrisisMonitor:
         # Check obstructions
         if metrics.get("obstructed", False):
             obstruction_pct = metrics.get("obstruction_percent", 0)
-            if obstruction_pct > self.thresholds["max_obstruction_percent"]:
+            max_obstruction = thresholds["max_obstruction_percent"]
+            if obstruction_pct > max_obstruction:
                 issue = Issue(
                     IssueType.OBSTRUCTION,
                     (
                         "critical"
-                        if obstruction_pct
-                        > self.thresholds["max_obstruction_percent"] * 2
+                        if obstruction_pct > max_obstruction * 2
                         else "warning"
                     ),
-                    f"Obstruction detected: {obstruction_pct*100:.1f}% (threshold: {self.thresholds['max_obstruction_percent']*100:.1f}%)",
+                    f"Obstruction detected: {obstruction_pct*100:.1f}% (threshold: {max_obstruction*100:.1f}%)",
                     datetime.now(),
                     metrics,
                 )
                 detected_issues.append(issue)
 
         # Check SNR
-        if metrics.get("snr", 0) < self.thresholds["min_snr"]:
+        min_snr = thresholds["min_snr"]
+        if metrics.get("snr", 0) < min_snr:
             issue = Issue(
                 IssueType.SIGNAL_DEGRADATION,
                 "warning",
-                f"Low SNR: {metrics['snr']:.1f} dB (threshold: {self.thresholds['min_snr']} dB)",
+                f"Low SNR: {metrics['snr']:.1f} dB (threshold: {min_snr} dB)",
                 datetime.now(),
                 metrics,
             )
@@ -243,17 +440,10 @@ class CrisisMonitor:
             self._add_issue(issue)
 
         # Store performance data
-        self.performance_history.append(
-            {
-                "timestamp": datetime.now().isoformat(),
-                "connection": active_conn.name,
-                "metrics": metrics.copy(),
-                "issues": len(self.active_issues),
-            }
-        )
+        record(time.monotonic_ns(), active_conn.name, metrics, len(self.active_issues))
 
         return {
-            "status": self._determine_overall_status(),
+            "status": self._determine_overall_status().label,
             "active_issues": [self._issue_to_dict(i) for i in self.active_issues],
             "resolved_issues_count": len(self.resolved_issues),
             "health": health_status,
@@ -286,9 +476,25 @@ class CrisisMonitor:
             ):
                 self._attempt_recovery(existing)
         else:
-            self.active_issues.append(issue)
+            self._activate_issue(issue)
             logger.warning(f"New issue detected: {issue.description}")
-            self._trigger_callbacks("issue_detected", issue)
+            self._trigger_callbacks(MonitorEvent.ISSUE_DETECTED, issue)
+
+    def _activate_issue(self, issue: Issue):
+        """Add an issue to the active list and update severity tallies."""
+        self.active_issues.append(issue)
+        if issue.severity == "critical":
+            self._critical_count += 1
+        elif issue.severity == "warning":
+            self._warning_count += 1
+
+    def _deactivate_issue(self, issue: Issue):
+        """Remove an issue from the active list and update severity tallies."""
+        self.active_issues.remove(issue)
+        if issue.severity == "critical":
+            self._critical_count -= 1
+        elif issue.severity == "warning":
+            self._warning_count -= 1
 
     def _attempt_recovery(self, issue: Issue):
         """Attempt automatic recovery for an issue."""
@@ -308,14 +514,14 @@ class CrisisMonitor:
         if recovery_func:
             success = recovery_func(issue)
             self._trigger_callbacks(
-                "recovery_attempted", {"issue": issue, "success": success}
+                MonitorEvent.RECOVERY_ATTEMPTED, {"issue": issue, "success": success}
             )
 
             if success:
                 issue.mark_resolved("automatic_recovery")
                 self.resolved_issues.append(issue)
-                self.active_issues.remove(issue)
-                self._trigger_callbacks("issue_resolved", issue)
+                self._deactivate_issue(issue)
+                self._trigger_callbacks(MonitorEvent.ISSUE_RESOLVED, issue)
 
     def _recover_high_latency(self, issue: Issue) -> bool:
         """Attempt to recover from high latency."""
@@ -350,20 +556,13 @@ class CrisisMonitor:
         logger.info("Attempting recovery from signal degradation")
         return self.connection_manager.auto_recover()
 
-    def _determine_overall_status(self) -> str:
+    def _determine_overall_status(self) -> OverallStatus:
         """Determine overall system status based on active issues."""
-        if not self.active_issues:
-            return "healthy"
-
-        critical_count = sum(1 for i in self.active_issues if i.severity == "critical")
-        if critical_count > 0:
-            return "critical"
-
-        warning_count = sum(1 for i in self.active_issues if i.severity == "warning")
-        if warning_count > 2:
-            return "degraded"
-
-        return "warning"
+        return _OVERALL_STATUS[
+            (self._critical_count > 0) << 2
+            | (self._warning_count > 2) << 1
+            | bool(self.active_issues)
+        ]
 
     def _issue_to_dict(self, issue: Issue) -> Dict[str, Any]:
         """Convert issue to dictionary."""
@@ -377,13 +576,13 @@ class CrisisMonitor:
             "metrics": issue.metrics,
         }
 
-    def _trigger_callbacks(self, event: str, data: Any):
+    def _trigger_callbacks(self, event: MonitorEvent, data: Any):
         """Trigger registered callbacks for an event."""
-        for callback in self.callbacks.get(event, []):
+        for callback in self.callbacks[event]:
             try:
                 callback(data)
             except Exception as e:
-                logger.error(f"Error in callback for {event}: {e}")
+                logger.error(f"Error in callback for {event.name.lower()}: {e}")
 
     def get_performance_report(self, hours: int = 24) -> Dict[str, Any]:
         """
@@ -395,24 +594,20 @@ class CrisisMonitor:
         Returns:
             Performance report dictionary
         """
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        recent_history = [
-            h
-            for h in self.performance_history
-            if datetime.fromisoformat(h["timestamp"]) > cutoff_time
-        ]
+        history = self.performance_history
+        recent = history.since(time.monotonic_ns() - hours * NS_PER_HOUR)
 
-        if not recent_history:
+        if not len(recent):
             return {"error": "No data available for specified period"}
 
         # Calculate statistics
-        latencies = [h["metrics"].get("latency_ms", 0) for h in recent_history]
-        downlinks = [h["metrics"].get("downlink_mbps", 0) for h in recent_history]
-        uplinks = [h["metrics"].get("uplink_mbps", 0) for h in recent_history]
+        latencies = history.columns["latency_ms"][recent]
+        downlinks = history.columns["downlink_mbps"][recent]
+        uplinks = history.columns["uplink_mbps"][recent]
 
         report = {
             "period_hours": hours,
-            "samples": len(recent_history),
+            "samples": len(recent),
             "latency_ms": {
                 "avg": float(np.mean(latencies)),
                 "min": float(np.min(latencies)),
@@ -445,26 +640,30 @@ class CrisisMonitor:
             filepath: Path to export file
             hours: Number of hours of data to export
         """
-        import json
-
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        recent_history = [
-            h
-            for h in self.performance_history
-            if datetime.fromisoformat(h["timestamp"]) > cutoff_time
-        ]
+        history = self.performance_history
+        cutoff = time.monotonic_ns() - hours * NS_PER_HOUR
+        recent_history = history.to_records(history.since(cutoff))
 
         export_data = {
             "exported_at": datetime.now().isoformat(),
             "period_hours": hours,
             "scenario": self.scenario.value,
-            "thresholds": self.thresholds,
+            "thresholds": dict(self.thresholds),
             "performance_history": recent_history,
             "active_issues": [self._issue_to_dict(i) for i in self.active_issues],
             "resolved_issues": [self._issue_to_dict(i) for i in self.resolved_issues],
         }
 
-        with open(filepath, "w") as f:
-            json.dump(export_data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(filepath, "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        export_data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                    )
+                )
+        else:
+            with open(filepath, "w") as f:
+                json.dump(export_data, f, indent=2)
 
         logger.info(f"Exported {len(recent_history)} samples to {filepath}")
@@ -129,6 +129,17 @@ class DiagnosticsEngine:
 
         return telemetry
 
+    def _collect_n_telemetry(self, connection, n: int):
+        """
+        Collect n telemetry samples into history without running checks.
+
+        Args:
+            connection: Connection to sample
+            n: Number of samples to collect
+        """
+        collect = self._collect_telemetry
+        self.telemetry_history.extend(collect(connection) for _ in range(n))
+
     def _check_connection_quality(self, telemetry: Dict[str, Any]):
         """Check connection quality metrics."""
         metrics = telemetry.get("metrics", {})
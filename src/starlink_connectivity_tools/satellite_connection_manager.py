@@ -1,12 +1,16 @@
 """Unified satellite connection management with automatic failover."""
 
+import itertools
 import time
 import random
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Tuple
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
 from loguru import logger
 
+from ._pairing_heap import PairingHeap
+from ._rwlock import ReadWriteLock
 from .starlink_api import StarlinkAPI
 
 
@@ -20,19 +24,43 @@ class ConnectionType(Enum):
     OTHER = "other"
 
 
-class ConnectionStatus(Enum):
+class ConnectionStatus(IntEnum):
     """Connection status states."""
 
-    CONNECTED = "connected"
-    DEGRADED = "degraded"
-    DISCONNECTED = "disconnected"
-    CONNECTING = "connecting"
-    FAILED = "failed"
+    CONNECTED = 0
+    DEGRADED = 1
+    DISCONNECTED = 2
+    CONNECTING = 3
+    FAILED = 4
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used when serializing the status."""
+        return self.name.lower()
+
+
+# Returned by get_metrics() when a reading fails
+_NO_METRICS: Mapping[str, Any] = MappingProxyType({})
 
 
 class SatelliteConnection:
     """Represents a single satellite connection."""
 
+    __slots__ = (
+        "name",
+        "connection_type",
+        "priority",
+        "api_client",
+        "status",
+        "metrics",
+        "_metrics_view",
+        "last_check",
+        "failure_count",
+        "last_failure",
+        "_pq_node",
+        "_alive",
+    )
+
     def __init__(
         self,
         name: str,
@@ -54,25 +82,59 @@ class SatelliteConnection:
         self.priority = priority
         self.api_client = api_client
         self.status = ConnectionStatus.DISCONNECTED
-        self.metrics = {}
+        # Updated in place on every reading; get_metrics() hands out a view
+        self.metrics: Dict[str, Any] = {}
+        self._metrics_view = MappingProxyType(self.metrics)
         self.last_check = None
         self.failure_count = 0
         self.last_failure = None
+        self._pq_node = None  # Handle into the manager's priority queue
+        self._alive = True  # False once tombstoned by failover
+
+    @classmethod
+    def simulated(
+        cls, name: str, connection_type: ConnectionType, priority: int = 0
+    ) -> "SatelliteConnection":
+        """
+        Create a connection that never touches the network.
+
+        Starlink connections get a simulation-mode StarlinkAPI, so no gRPC
+        channel is opened; other types already produce simulated metrics.
 
-    def get_metrics(self) -> Dict[str, Any]:
-        """Get current connection metrics."""
+        Args:
+            name: Connection name
+            connection_type: Type of satellite connection
+            priority: Priority level (higher = more preferred)
+
+        Returns:
+            Simulated SatelliteConnection object
+        """
+        api_client = None
+        if connection_type == ConnectionType.STARLINK:
+            api_client = StarlinkAPI(simulation_mode=True)
+        return cls(name, connection_type, priority, api_client)
+
+    def get_metrics(self) -> Mapping[str, Any]:
+        """
+        Get current connection metrics.
+
+        Returns:
+            Read-only live view of the metrics; copy it to keep a snapshot
+        """
         if self.connection_type == ConnectionType.STARLINK and self.api_client:
             try:
                 status = self.api_client.get_status()
-                self.metrics = {
-                    "latency_ms": status.get("ping_latency_ms", 0),
-                    "downlink_mbps": status.get("downlink_throughput_bps", 0)
-                    / 1_000_000,
-                    "uplink_mbps": status.get("uplink_throughput_bps", 0) / 1_000_000,
-                    "snr": status.get("snr", 0),
-                    "obstructed": status.get("obstructed", False),
-                    "state": status.get("state", "UNKNOWN"),
-                }
+                metrics = self.metrics
+                metrics["latency_ms"] = status.get("ping_latency_ms", 0)
+                metrics["downlink_mbps"] = (
+                    status.get("downlink_throughput_bps", 0) / 1_000_000
+                )
+                metrics["uplink_mbps"] = (
+                    status.get("uplink_throughput_bps", 0) / 1_000_000
+                )
+                metrics["snr"] = status.get("snr", 0)
+                metrics["obstructed"] = status.get("obstructed", False)
+                metrics["state"] = status.get("state", "UNKNOWN")
                 self.last_check = time.time()
 
                 # Update status based on metrics
@@ -85,19 +147,20 @@ class SatelliteConnection:
                 else:
                     self.status = ConnectionStatus.CONNECTING
 
-                return self.metrics
+                return self._metrics_view
 
             except Exception as e:
                 logger.error(f"Error getting metrics for {self.name}: {e}")
                 self.failure_count += 1
                 self.last_failure = time.time()
                 self.status = ConnectionStatus.FAILED
-                return {}
+                return _NO_METRICS
         else:
             # Simulated metrics for other connection types
-            return self._get_simulated_metrics()
+            self._update_simulated_metrics()
+            return self._metrics_view
 
-    def _get_simulated_metrics(self) -> Dict[str, Any]:
+    def _update_simulated_metrics(self):
         """Generate simulated metrics for non-Starlink connections."""
         base_latency = {
             ConnectionType.IRIDIUM: 1500,
@@ -110,14 +173,13 @@ class SatelliteConnection:
             -100, 100
         )
 
-        return {
-            "latency_ms": latency,
-            "downlink_mbps": random.uniform(0.5, 5.0),
-            "uplink_mbps": random.uniform(0.3, 2.0),
-            "snr": random.uniform(5.0, 12.0),
-            "obstructed": False,
-            "state": "CONNECTED",
-        }
+        metrics = self.metrics
+        metrics["latency_ms"] = latency
+        metrics["downlink_mbps"] = random.uniform(0.5, 5.0)
+        metrics["uplink_mbps"] = random.uniform(0.3, 2.0)
+        metrics["snr"] = random.uniform(5.0, 12.0)
+        metrics["obstructed"] = False
+        metrics["state"] = "CONNECTED"
 
     def test_connection(self) -> bool:
         """Test if connection is working."""
@@ -128,13 +190,34 @@ class SatelliteConnection:
 class SatelliteConnectionManager:
     """Manages multiple satellite connections with automatic failover."""
 
+    __slots__ = (
+        "_pq",
+        "_counter",
+        "_tombstoned",
+        "_ordered",
+        "active_connection",
+        "failover_threshold",
+        "check_interval",
+        "last_health_check",
+        "_lock",
+    )
+
     def __init__(self):
         """Initialize the connection manager."""
-        self.connections: List[SatelliteConnection] = []
+        # Min-heap keyed on (-priority, insertion order) so the root is the
+        # highest-priority connection; pairing heap allows priority updates
+        self._pq = PairingHeap()
+        self._counter = itertools.count()
+        # Failed-over connections evicted from the heap until recovered
+        self._tombstoned: List[SatelliteConnection] = []
+        # Cached priority order; reset whenever a connection's key changes
+        self._ordered: Optional[Tuple[SatelliteConnection, ...]] = None
         self.active_connection: Optional[SatelliteConnection] = None
         self.failover_threshold = 3  # Number of failures before failover
         self.check_interval = 30  # Seconds between health checks
         self.last_health_check = None
+        # Stats/health readers share the lock; topology changes take it exclusively
+        self._lock = ReadWriteLock()
 
     def add_connection(
         self, name: str, connection_type: ConnectionType, priority: int = 0, **kwargs
@@ -151,25 +234,74 @@ class SatelliteConnectionManager:
         Returns:
             Created SatelliteConnection object
         """
-        api_client = None
-
-        if connection_type == ConnectionType.STARLINK:
-            api_client = StarlinkAPI(
-                target=kwargs.get("target"),
-                simulation_mode=kwargs.get("simulation_mode", False),
+        if kwargs.get("simulation_mode", False):
+            connection = SatelliteConnection.simulated(name, connection_type, priority)
+        else:
+            api_client = None
+            if connection_type == ConnectionType.STARLINK:
+                api_client = StarlinkAPI(target=kwargs.get("target"))
+            connection = SatelliteConnection(
+                name, connection_type, priority, api_client
             )
 
-        connection = SatelliteConnection(name, connection_type, priority, api_client)
-        self.connections.append(connection)
-
-        # Sort by priority (highest first)
-        self.connections.sort(key=lambda c: c.priority, reverse=True)
+        with self._lock.write():
+            connection._pq_node = self._pq.insert(
+                (-priority, next(self._counter)), connection
+            )
+            self._ordered = None
 
         logger.info(
             f"Added connection: {name} ({connection_type.value}) with priority {priority}"
         )
         return connection
 
+    @property
+    def connections(self) -> Tuple[SatelliteConnection, ...]:
+        """
+        Connections ordered by priority (highest first, ties in insertion order).
+
+        A read-only snapshot: use add_connection and update_priority to
+        change the set or its order.
+        """
+        with self._lock.read():
+            return self._ordered_connections()
+
+    def _ordered_connections(self) -> Tuple[SatelliteConnection, ...]:
+        """Priority-ordered connections; caller must hold the lock."""
+        # Failover and recovery move connections between the heap and
+        # _tombstoned without changing their keys, so the order survives them
+        if self._ordered is None:
+            nodes = list(self._pq)
+            nodes.extend(conn._pq_node for conn in self._tombstoned)
+            nodes.sort(key=lambda node: node.key)
+            self._ordered = tuple(node.value for node in nodes)
+        return self._ordered
+
+    def update_priority(self, connection: SatelliteConnection, priority: int):
+        """
+        Change the priority of a managed connection.
+
+        Args:
+            connection: Connection previously returned by add_connection
+            priority: New priority level (higher = more preferred)
+        """
+        with self._lock.write():
+            node = connection._pq_node
+            key = (-priority, node.key[1])
+            if connection in self._tombstoned:
+                # Evicted nodes are detached from the heap; a failed-over
+                # connection not yet evicted is still in it and is moved below
+                node.key = key
+            elif key < node.key:
+                self._pq.decrease_key(node, key)
+            else:
+                # Lowering priority is an increase-key: remove and re-insert
+                self._pq.delete(node)
+                connection._pq_node = self._pq.insert(key, connection)
+            connection.priority = priority
+            self._ordered = None
+        logger.info(f"Updated priority of {connection.name} to {priority}")
+
     def get_active_connection(self) -> Optional[SatelliteConnection]:
         """Get the currently active connection."""
         return self.active_connection
@@ -181,16 +313,50 @@ class SatelliteConnectionManager:
         Returns:
             Best available connection or None
         """
-        if not self.connections:
-            logger.warning("No connections available")
-            return None
-
-        # Test connections in priority order
-        for connection in self.connections:
-            if connection.test_connection():
+        # Candidates are taken under the lock but tested outside it, since
+        # testing may hit the network
+        with self._lock.write():
+            # Lazily evict connections tombstoned by failover from the top
+            while self._pq and not self._pq.find_min().value._alive:
+                self._tombstoned.append(self._pq.delete_min().value)
+
+            if not self._pq and not self._tombstoned:
+                logger.warning("No connections available")
+                return None
+
+            best = self._pq.find_min().value if self._pq else None
+
+        # Fast path: the highest-priority connection is usually healthy
+        if best is not None and best.test_connection():
+            logger.info(f"Selected connection: {best.name}")
+            return best
+
+        # Test the remaining connections in priority order
+        with self._lock.read():
+            candidates = [
+                node.value for node in sorted(self._pq, key=lambda node: node.key)
+            ]
+            failed_over = list(self._tombstoned)
+        for connection in candidates:
+            if (
+                connection is not best
+                and connection._alive
+                and connection.test_connection()
+            ):
                 logger.info(f"Selected connection: {connection.name}")
                 return connection
 
+        # Failed-over connections are only excluded until they pass a test
+        # again: retry them last, in priority order, and revive one that works
+        retry = [connection for connection in candidates if not connection._alive]
+        retry.extend(failed_over)
+        retry.sort(key=lambda connection: connection._pq_node.key)
+        for connection in retry:
+            if self._revive_if_working(connection):
+                connection.failure_count = 0
+                logger.info(f"Selected recovered connection: {connection.name}")
+                return connection
+
         logger.error("No working connections found")
         return None
 
@@ -204,7 +370,8 @@ class SatelliteConnectionManager:
         connection = self.select_best_connection()
 
         if connection:
-            self.active_connection = connection
+            with self._lock.write():
+                self.active_connection = connection
             logger.info(f"Connected via {connection.name}")
             return True
 
@@ -218,23 +385,26 @@ class SatelliteConnectionManager:
         Returns:
             Dictionary with health status of all connections
         """
+        with self._lock.read():
+            active = self.active_connection
+            connections = self._ordered_connections()
+
         health_status = {
             "timestamp": datetime.now().isoformat(),
-            "active_connection": (
-                self.active_connection.name if self.active_connection else None
-            ),
+            "active_connection": active.name if active else None,
             "connections": [],
         }
 
-        for connection in self.connections:
+        # Query metrics outside the lock; they may hit the network
+        for connection in connections:
             metrics = connection.get_metrics()
             health_status["connections"].append(
                 {
                     "name": connection.name,
                     "type": connection.connection_type.value,
-                    "status": connection.status.value,
+                    "status": connection.status.label,
                     "priority": connection.priority,
-                    "metrics": metrics,
+                    "metrics": dict(metrics),
                     "failure_count": connection.failure_count,
                 }
             )
@@ -249,24 +419,35 @@ class SatelliteConnectionManager:
         Returns:
             True if failover occurred
         """
-        if not self.active_connection:
+        with self._lock.write():
+            failing = self.active_connection
+            if failing is not None:
+                # Check if current connection is still healthy
+                if failing.failure_count < self.failover_threshold:
+                    return False
+
+                logger.warning(
+                    f"Connection {failing.name} has failed {failing.failure_count} times. "
+                    "Attempting failover..."
+                )
+
+                # Exclude the failing connection until it is recovered
+                failing._alive = False
+
+        if failing is None:
             return self.connect()
 
-        # Check if current connection is still healthy
-        if self.active_connection.failure_count >= self.failover_threshold:
-            logger.warning(
-                f"Connection {self.active_connection.name} has failed {self.active_connection.failure_count} times. "
-                "Attempting failover..."
-            )
-
-            # Try to find a better connection
-            new_connection = self.select_best_connection()
+        # Try to find a better connection; tested without holding the lock
+        new_connection = self.select_best_connection()
 
-            if new_connection and new_connection != self.active_connection:
-                old_name = self.active_connection.name
+        if new_connection and new_connection is not failing:
+            with self._lock.write():
+                # Another caller may have switched connections meanwhile
+                if self.active_connection is not failing:
+                    return False
                 self.active_connection = new_connection
-                logger.info(f"Failed over from {old_name} to {new_connection.name}")
-                return True
+            logger.info(f"Failed over from {failing.name} to {new_connection.name}")
+            return True
 
         return False
 
@@ -277,22 +458,27 @@ class SatelliteConnectionManager:
         Returns:
             Dictionary with connection statistics
         """
+        with self._lock.read():
+            return self._connection_stats()
+
+    def _connection_stats(self) -> Dict[str, Any]:
+        """Body of get_connection_stats(); caller must hold the lock."""
         stats = {
-            "total_connections": len(self.connections),
+            "total_connections": len(self._pq) + len(self._tombstoned),
             "active_connection": (
                 self.active_connection.name if self.active_connection else None
             ),
             "connections": {},
         }
 
-        for connection in self.connections:
+        for connection in self._ordered_connections():
             stats["connections"][connection.name] = {
                 "type": connection.connection_type.value,
-                "status": connection.status.value,
+                "status": connection.status.label,
                 "priority": connection.priority,
                 "failure_count": connection.failure_count,
                 "last_check": connection.last_check,
-                "metrics": connection.metrics,
+                "metrics": dict(connection.metrics),
             }
 
         return stats
@@ -309,12 +495,18 @@ class SatelliteConnectionManager:
         """
         target_connection = None
 
-        if connection_name:
-            target_connection = next(
-                (c for c in self.connections if c.name == connection_name), None
-            )
-        else:
-            target_connection = self.active_connection
+        with self._lock.read():
+            if connection_name:
+                target_connection = next(
+                    (
+                        c
+                        for c in self._ordered_connections()
+                        if c.name == connection_name
+                    ),
+                    None,
+                )
+            else:
+                target_connection = self.active_connection
 
         if not target_connection:
             logger.error("No connection to recover")
@@ -332,20 +524,44 @@ class SatelliteConnectionManager:
                 if target_connection.api_client.reboot():
                     time.sleep(60)  # Wait for reboot
                     target_connection.failure_count = 0
-                    return target_connection.test_connection()
+                    return self._revive_if_working(target_connection)
             except Exception as e:
                 logger.error(f"Failed to reboot: {e}")
 
         # Reset failure count and try again
         target_connection.failure_count = 0
-        return target_connection.test_connection()
+        return self._revive_if_working(target_connection)
+
+    def _revive_if_working(self, connection: SatelliteConnection) -> bool:
+        """Test a connection and make it selectable again if it works."""
+        if not connection.test_connection():
+            return False
+
+        with self._lock.write():
+            if not connection._alive:
+                connection._alive = True
+                if connection in self._tombstoned:
+                    self._tombstoned.remove(connection)
+                    connection._pq_node = self._pq.insert(
+                        connection._pq_node.key, connection
+                    )
+        return True
 
     def close_all(self):
         """Close all connections."""
-        for connection in self.connections:
+        with self._lock.write():
+            connections = self._ordered_connections()
+            self._pq.clear()
+            self._tombstoned.clear()
+            self._ordered = None
+            self.active_connection = None
+
+        # Closing may block on I/O, so do it after releasing the lock
+        for connection in connections:
             if connection.api_client and hasattr(connection.api_client, "close"):
-                connection.api_client.close()
+                try:
+                    connection.api_client.close()
+                except Exception as e:
+                    logger.error(f"Error closing {connection.name}: {e}")
 
-        self.connections.clear()
-        self.active_connection = None
         logger.info("Closed all connections")
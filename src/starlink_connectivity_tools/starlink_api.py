@@ -15,6 +15,24 @@ except ImportError:
     STARLINK_AVAILABLE = False
     logger.warning("starlink-grpc not available. Using simulation mode.")
 
+# Mean and spread of the simulated latency, downlink, uplink and SNR series
+_HISTORY_MEAN = np.array([[30.0], [50_000_000.0], [10_000_000.0], [9.0]])
+_HISTORY_STD = np.array([[10.0], [10_000_000.0], [2_000_000.0], [2.0]])
+
+# Dish state names indexed by the state integer
+_STATE_NAMES = ("UNKNOWN", "BOOTING", "STOWED", "SEARCHING", "CONNECTED")
+
+# Alert name for each bit of the dish alerts bitfield, lowest bit first
+_ALERT_NAMES = (
+    "MOTORS_STUCK",
+    "THERMAL_THROTTLE",
+    "THERMAL_SHUTDOWN",
+    "MAST_NOT_NEAR_VERTICAL",
+    "SLOW_ETHERNET_SPEEDS",
+    "SOFTWARE_INSTALL_PENDING",
+)
+_KNOWN_ALERTS_MASK = (1 << len(_ALERT_NAMES)) - 1
+
 
 class StarlinkAPI:
     """Interface to Starlink dish for monitoring and control operations."""
@@ -256,30 +274,19 @@ class StarlinkAPI:
 
     def _parse_state(self, state: int) -> str:
         """Parse dish state integer to human-readable string."""
-        states = {
-            0: "UNKNOWN",
-            1: "BOOTING",
-            2: "STOWED",
-            3: "SEARCHING",
-            4: "CONNECTED",
-        }
-        return states.get(state, f"UNKNOWN_{state}")
+        if 0 <= state < len(_STATE_NAMES):
+            return _STATE_NAMES[state]
+        return f"UNKNOWN_{state}"
 
     def _parse_alerts(self, alerts: int) -> List[str]:
         """Parse alerts bitfield to list of alert strings."""
         alert_list = []
-        alert_names = {
-            1: "MOTORS_STUCK",
-            2: "THERMAL_THROTTLE",
-            4: "THERMAL_SHUTDOWN",
-            8: "MAST_NOT_NEAR_VERTICAL",
-            16: "SLOW_ETHERNET_SPEEDS",
-            32: "SOFTWARE_INSTALL_PENDING",
-        }
-
-        for bit, name in alert_names.items():
-            if alerts & bit:
-                alert_list.append(name)
+        # Visit only the set bits, lowest first; unknown bits are ignored
+        mask = alerts & _KNOWN_ALERTS_MASK
+        while mask:
+            bit = mask & -mask
+            alert_list.append(_ALERT_NAMES[bit.bit_length() - 1])
+            mask ^= bit
 
         return alert_list
 
@@ -300,10 +307,10 @@ class StarlinkAPI:
 
     def _get_simulated_history(self, samples: int) -> Dict[str, Any]:
         """Generate simulated history data for testing."""
-        latency = list(30 + 10 * np.random.randn(samples))
-        downlink = list(50_000_000 + 10_000_000 * np.random.randn(samples))
-        uplink = list(10_000_000 + 2_000_000 * np.random.randn(samples))
-        snr = list(9 + 2 * np.random.randn(samples))
+        # One draw for all four series; tolist() yields plain floats
+        latency, downlink, uplink, snr = (
+            _HISTORY_MEAN + _HISTORY_STD * np.random.randn(4, samples)
+        ).tolist()
         obstructed = [False] * samples
 
         return {
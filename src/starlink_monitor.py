@@ -4,11 +4,54 @@ Monitors Starlink connection health and performance
 """
 
 import logging
+from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class StarlinkMetrics:
+    """Immutable snapshot of Starlink dish metrics"""
+
+    # Declared by hand because dataclass(slots=True) requires Python 3.10+
+    __slots__ = (
+        "timestamp",
+        "status",
+        "satellites_connected",
+        "download_speed",
+        "upload_speed",
+        "latency",
+        "packet_loss",
+        "signal_strength",
+        "snr",
+        "azimuth",
+        "elevation",
+        "obstruction_percent",
+        "dish_power_usage",
+        "dish_temp",
+        "router_temp",
+        "boot_count",
+    )
+
+    timestamp: float
+    status: str
+    satellites_connected: int
+    download_speed: float
+    upload_speed: float
+    latency: float
+    packet_loss: float
+    signal_strength: float
+    snr: float
+    azimuth: float
+    elevation: float
+    obstruction_percent: float
+    dish_power_usage: float
+    dish_temp: float
+    router_temp: float
+    boot_count: int
+
+
 class StarlinkMonitor:
     """Monitors Starlink connection status and health"""
 
@@ -14,6 +14,7 @@ A comprehensive tool for monitoring Starlink connectivity with features includin
 import argparse
 import json
 import logging
+import os
 import signal
 import subprocess
 import sys
@@ -27,6 +28,7 @@ import statistics
 
 # Constants
 PACKET_LOSS_DEGRADED_THRESHOLD = 0.25  # 25% packet loss threshold for degraded status
+REPORT_SEPARATOR = "=" * 60
 
 
 # Default configuration
@@ -437,38 +439,42 @@ class StarlinkMonitor:
         if not report:
             return
         
-        print("\n" + "="*60)
-        print("STARLINK CONNECTIVITY REPORT")
-        print("="*60)
+        total_checks = report['period']['total_checks']
+        latency = report['performance']['latency']
+        packet_loss = report['performance']['packet_loss']
+        
+        # Assembled first and written in one call rather than line by line
+        lines = ["", REPORT_SEPARATOR, "STARLINK CONNECTIVITY REPORT", REPORT_SEPARATOR]
         
         if self.crisis_mode:
-            print("⚠️  CRISIS MODE ACTIVE")
+            lines.append("⚠️  CRISIS MODE ACTIVE")
         
-        print(f"\nPeriod: {report['period']['start']} to {report['period']['end']}")
-        print(f"Total Checks: {report['period']['total_checks']}")
+        lines.append(f"\nPeriod: {report['period']['start']} to {report['period']['end']}")
+        lines.append(f"Total Checks: {total_checks}")
         
-        print(f"\nConnectivity Success Rate: {report['connectivity']['success_rate']:.1%}")
-        print("\nStatus Breakdown:")
+        lines.append(f"\nConnectivity Success Rate: {report['connectivity']['success_rate']:.1%}")
+        lines.append("\nStatus Breakdown:")
         for status, count in sorted(report['connectivity']['status_breakdown'].items()):
-            pct = count / report['period']['total_checks'] * 100
-            print(f"  {status.upper():12s}: {count:4d} ({pct:5.1f}%)")
+            pct = count / total_checks * 100
+            lines.append(f"  {status.upper():12s}: {count:4d} ({pct:5.1f}%)")
         
-        if report['performance']['latency']['avg']:
-            print(f"\nLatency Statistics:")
-            print(f"  Min:    {report['performance']['latency']['min']:.1f} ms")
-            print(f"  Max:    {report['performance']['latency']['max']:.1f} ms")
-            print(f"  Avg:    {report['performance']['latency']['avg']:.1f} ms")
-            print(f"  Median: {report['performance']['latency']['median']:.1f} ms")
+        if latency['avg']:
+            lines.append("\nLatency Statistics:")
+            lines.append(f"  Min:    {latency['min']:.1f} ms")
+            lines.append(f"  Max:    {latency['max']:.1f} ms")
+            lines.append(f"  Avg:    {latency['avg']:.1f} ms")
+            lines.append(f"  Median: {latency['median']:.1f} ms")
         
-        if report['performance']['packet_loss']['avg'] is not None:
-            print(f"\nPacket Loss:")
-            print(f"  Avg: {report['performance']['packet_loss']['avg']:.1%}")
-            print(f"  Max: {report['performance']['packet_loss']['max']:.1%}")
+        if packet_loss['avg'] is not None:
+            lines.append("\nPacket Loss:")
+            lines.append(f"  Avg: {packet_loss['avg']:.1%}")
+            lines.append(f"  Max: {packet_loss['max']:.1%}")
         
         threshold_met = "✓" if report['alerts']['success_rate_threshold_met'] else "✗"
-        print(f"\nThreshold Status: {threshold_met}")
+        lines.append(f"\nThreshold Status: {threshold_met}")
         
-        print("="*60 + "\n")
+        lines.append(REPORT_SEPARATOR + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def load_config(config_file: Optional[str] = None) -> Dict[str, Any]:
@@ -517,8 +523,12 @@ def create_example_config(output_file: str = "starlink_config.json"):
     print("Edit this file to customize monitoring parameters")
 
 
-def main():
-    """Main entry point for the Starlink connectivity tool"""
+# Subcommands that take no options; invoked bare, they skip the parser
+_BARE_COMMANDS = frozenset({'single-check', 'reboot'})
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser"""
     parser = argparse.ArgumentParser(
         description='Starlink Connectivity Monitoring Tool',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -568,7 +578,21 @@ Examples:
     config_parser.add_argument('--output', '-o', type=str, default='starlink_config.json',
                               help='Output file for configuration')
     
-    args = parser.parse_args()
+    return parser
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    """Parse arguments, short-circuiting bare option-less subcommands"""
+    if len(argv) == 1 and argv[0] in _BARE_COMMANDS:
+        # Same namespace argparse would produce with every global left unset
+        return argparse.Namespace(config=None, crisis_mode=False,
+                                  verbose=False, command=argv[0])
+    return _build_parser().parse_args(argv)
+
+
+def main():
+    """Main entry point for the Starlink connectivity tool"""
+    args = _parse_args(sys.argv[1:])
     
     # Handle create-config command
     if args.command == 'create-config':
@@ -622,6 +646,13 @@ Examples:
         
         return 0
     
+    except BrokenPipeError:
+        # Output piped into e.g. `head` that exited early; point stdout at
+        # devnull so the interpreter's final flush does not raise again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    
     except Exception as e:
         monitor.logger.error(f"Fatal error: {e}", exc_info=True)
         return 1
@@ -5,22 +5,62 @@ This module provides classes and methods for managing bandwidth allocation
 across Starlink connections with support for prioritization.
 """
 
-from typing import Optional, Dict, Any
-from dataclasses import dataclass, field
+from collections import deque
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Deque, List, Mapping
 from datetime import datetime
 
+# Priorities above MAX_PRIORITY share the top bucket of the waiting queue
+MAX_PRIORITY = 10
+_PRIORITY_BUCKETS = 8
+
+
+def _priority_bucket(priority: int) -> int:
+    """Map a priority onto one of the waiting-queue buckets."""
+    clamped = min(max(priority, 0), MAX_PRIORITY)
+    return clamped * _PRIORITY_BUCKETS // (MAX_PRIORITY + 1)
+
 
-@dataclass
 class BandwidthAllocation:
     """Represents a bandwidth allocation for a connection."""
     
-    connection_id: str
-    destination: str
-    requested_bandwidth: float  # Mbps
-    allocated_bandwidth: float = 0.0  # Mbps
-    priority: int = 0  # Higher number = higher priority
-    timestamp: datetime = field(default_factory=datetime.now)
-    status: str = "pending"
+    # A plain slotted class: dataclass(slots=True) requires Python 3.10+ and
+    # hand-declared __slots__ clash with dataclass field defaults
+    __slots__ = (
+        "connection_id",
+        "destination",
+        "requested_bandwidth",
+        "allocated_bandwidth",
+        "priority",
+        "timestamp",
+        "status",
+    )
+    
+    def __init__(
+        self,
+        connection_id: str,
+        destination: str,
+        requested_bandwidth: float,  # Mbps
+        allocated_bandwidth: float = 0.0,  # Mbps
+        priority: int = 0,  # Higher number = higher priority
+        timestamp: Optional[datetime] = None,
+        status: str = "pending",
+    ):
+        self.connection_id = connection_id
+        self.destination = destination
+        self.requested_bandwidth = requested_bandwidth
+        self.allocated_bandwidth = allocated_bandwidth
+        self.priority = priority
+        self.timestamp = timestamp if timestamp is not None else datetime.now()
+        self.status = status
+    
+    def _fields(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
     
     def __repr__(self):
         return (f"BandwidthAllocation(connection_id='{self.connection_id}', "
@@ -49,6 +89,13 @@ class BandwidthOptimizer:
         self.total_bandwidth = total_bandwidth
         self.available_bandwidth = total_bandwidth
         self.allocations: Dict[str, BandwidthAllocation] = {}
+        self._allocations_view = MappingProxyType(self.allocations)
+        # Partial/queued allocations waiting for bandwidth, FIFO within a
+        # priority bucket; bit i of the mask is set while bucket i is non-empty
+        self._waiting: List[Deque[BandwidthAllocation]] = [
+            deque() for _ in range(_PRIORITY_BUCKETS)
+        ]
+        self._waiting_mask = 0
         
     def allocate_bandwidth(
         self,
@@ -78,9 +125,9 @@ class BandwidthOptimizer:
             ... )
         """
         # Check if allocation already exists for this connection
-        if connection_id in self.allocations:
+        existing = self.allocations.get(connection_id)
+        if existing is not None:
             # Update existing allocation
-            existing = self.allocations[connection_id]
             self.available_bandwidth += existing.allocated_bandwidth
             
         # Create new allocation
@@ -102,6 +149,7 @@ class BandwidthOptimizer:
             allocation.allocated_bandwidth = self.available_bandwidth
             allocation.status = "partial" if self.available_bandwidth > 0 else "queued"
             self.available_bandwidth = 0
+            self._enqueue_waiting(allocation)
             
         # Store the allocation
         self.allocations[connection_id] = allocation
@@ -112,18 +160,56 @@ class BandwidthOptimizer:
         """
         Release bandwidth allocated to a connection.
         
+        The freed bandwidth is handed to partial or queued allocations,
+        highest priority first.
+        
         Args:
             connection_id: Connection identifier to release
             
         Returns:
             True if bandwidth was released, False if connection not found
         """
-        if connection_id in self.allocations:
-            allocation = self.allocations[connection_id]
-            self.available_bandwidth += allocation.allocated_bandwidth
-            del self.allocations[connection_id]
-            return True
-        return False
+        allocation = self.allocations.pop(connection_id, None)
+        if allocation is None:
+            return False
+        self.available_bandwidth += allocation.allocated_bandwidth
+        self._grant_waiting()
+        return True
+    
+    def _enqueue_waiting(self, allocation: BandwidthAllocation) -> None:
+        """Queue an allocation that received less than it requested."""
+        bucket = _priority_bucket(allocation.priority)
+        self._waiting[bucket].append(allocation)
+        self._waiting_mask |= 1 << bucket
+    
+    def _grant_waiting(self) -> None:
+        """Top up waiting allocations from the available bandwidth."""
+        mask = self._waiting_mask
+        while mask and self.available_bandwidth > 0:
+            # Highest set bit is the highest-priority non-empty bucket
+            index = mask.bit_length() - 1
+            bucket = self._waiting[index]
+            while bucket and self.available_bandwidth > 0:
+                allocation = bucket[0]
+                if self.allocations.get(allocation.connection_id) is not allocation:
+                    # Released or replaced since it was queued
+                    bucket.popleft()
+                    continue
+                shortfall = (
+                    allocation.requested_bandwidth - allocation.allocated_bandwidth
+                )
+                grant = min(shortfall, self.available_bandwidth)
+                allocation.allocated_bandwidth += grant
+                self.available_bandwidth -= grant
+                if grant == shortfall:
+                    allocation.status = "allocated"
+                    bucket.popleft()
+                else:
+                    allocation.status = "partial"
+            if bucket:
+                break
+            mask &= ~(1 << index)
+        self._waiting_mask = mask
     
     def get_allocation(self, connection_id: str) -> Optional[BandwidthAllocation]:
         """
@@ -137,14 +223,15 @@ class BandwidthOptimizer:
         """
         return self.allocations.get(connection_id)
     
-    def get_all_allocations(self) -> Dict[str, BandwidthAllocation]:
+    def get_all_allocations(self) -> Mapping[str, BandwidthAllocation]:
         """
         Get all current bandwidth allocations.
         
         Returns:
-            Dictionary of all allocations keyed by connection_id
+            Read-only live view of all allocations keyed by connection_id,
+            in allocation order
         """
-        return self.allocations.copy()
+        return self._allocations_view
     
     def get_available_bandwidth(self) -> float:
         """
@@ -155,6 +242,18 @@ class BandwidthOptimizer:
         """
         return self.available_bandwidth
     
+    def get_allocated_bandwidth(self) -> float:
+        """
+        Get the bandwidth currently allocated across all connections.
+        
+        Every allocation change moves bandwidth to or from
+        available_bandwidth, so this is the total minus what is available.
+        
+        Returns:
+            Allocated bandwidth in Mbps
+        """
+        return self.total_bandwidth - self.available_bandwidth
+    
     def __repr__(self):
         return (f"BandwidthOptimizer(total={self.total_bandwidth}Mbps, "
                 f"available={self.available_bandwidth}Mbps, "
@@ -6,12 +6,24 @@ Provides utilities for checking connection status, measuring performance metrics
 and analyzing network availability.
 """
 
+import importlib.util
 import time
 import random
 from typing import Dict, Optional, List
 from dataclasses import dataclass
 from datetime import datetime
 
+# Only looked up here: NumPy is imported by the first statistics reduction
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+# (metric attribute, statistics key suffix, whether min/max are reported)
+_STAT_FIELDS = (
+    ("latency_ms", "latency_ms", True),
+    ("download_speed_mbps", "download_mbps", True),
+    ("upload_speed_mbps", "upload_mbps", True),
+    ("packet_loss_percent", "packet_loss_percent", False),
+)
+
 
 @dataclass
 class ConnectivityMetrics:
@@ -130,31 +142,49 @@ class StarlinkConnectivity:
         }
         
         if connected_metrics:
-            latencies = [m.latency_ms for m in connected_metrics if m.latency_ms is not None]
-            download_speeds = [m.download_speed_mbps for m in connected_metrics if m.download_speed_mbps is not None]
-            upload_speeds = [m.upload_speed_mbps for m in connected_metrics if m.upload_speed_mbps is not None]
-            packet_losses = [m.packet_loss_percent for m in connected_metrics if m.packet_loss_percent is not None]
-            
-            if latencies:
-                stats["avg_latency_ms"] = sum(latencies) / len(latencies)
-                stats["min_latency_ms"] = min(latencies)
-                stats["max_latency_ms"] = max(latencies)
-            
-            if download_speeds:
-                stats["avg_download_mbps"] = sum(download_speeds) / len(download_speeds)
-                stats["min_download_mbps"] = min(download_speeds)
-                stats["max_download_mbps"] = max(download_speeds)
-            
-            if upload_speeds:
-                stats["avg_upload_mbps"] = sum(upload_speeds) / len(upload_speeds)
-                stats["min_upload_mbps"] = min(upload_speeds)
-                stats["max_upload_mbps"] = max(upload_speeds)
-            
-            if packet_losses:
-                stats["avg_packet_loss_percent"] = sum(packet_losses) / len(packet_losses)
+            if NUMPY_AVAILABLE:
+                self._reduce_numpy(connected_metrics, stats)
+            else:
+                self._reduce_python(connected_metrics, stats)
         
         return stats
     
+    @staticmethod
+    def _reduce_numpy(connected_metrics: List[ConnectivityMetrics], stats: Dict):
+        """Reduce all metrics at once over a (samples, metrics) array."""
+        import numpy as np
+        
+        # Missing readings become NaN and are skipped by the nan* reductions
+        values = np.array(
+            [[getattr(m, attr) for attr, _, _ in _STAT_FIELDS] for m in connected_metrics],
+            dtype=np.float64,
+        )
+        present = ~np.isnan(values)
+        counts = present.sum(axis=0)
+        means = np.where(present, values, 0.0).sum(axis=0) / np.maximum(counts, 1)
+        mins = np.where(present, values, np.inf).min(axis=0)
+        maxs = np.where(present, values, -np.inf).max(axis=0)
+        
+        for col, (_, key, with_range) in enumerate(_STAT_FIELDS):
+            if not counts[col]:
+                continue
+            stats[f"avg_{key}"] = float(means[col])
+            if with_range:
+                stats[f"min_{key}"] = float(mins[col])
+                stats[f"max_{key}"] = float(maxs[col])
+    
+    @staticmethod
+    def _reduce_python(connected_metrics: List[ConnectivityMetrics], stats: Dict):
+        """Reduce each metric with the builtins when NumPy is unavailable."""
+        for attr, key, with_range in _STAT_FIELDS:
+            values = [getattr(m, attr) for m in connected_metrics if getattr(m, attr) is not None]
+            if not values:
+                continue
+            stats[f"avg_{key}"] = sum(values) / len(values)
+            if with_range:
+                stats[f"min_{key}"] = min(values)
+                stats[f"max_{key}"] = max(values)
+    
     def print_statistics(self):
         """Print formatted statistics summary."""
         stats = self.get_statistics()
@@ -5,13 +5,17 @@ Provides the StarlinkClient class for interacting with Starlink user terminals
 via gRPC protocol.
 """
 
-import grpc
+from __future__ import annotations
+
+import functools
+import importlib.util
 import ipaddress
 import asyncio
+import sys
 import requests
+from types import ModuleType
 from typing import Dict, Any, Optional, List, AsyncIterator
 from datetime import datetime, timedelta
-from grpc_reflection.v1alpha import reflection_pb2, reflection_pb2_grpc
 
 from .models import (
     DeviceStatus,
@@ -28,6 +32,52 @@ from .models import (
 )
 
 
+def _lazy_import(name: str) -> ModuleType:
+    """
+    Import a module lazily.
+
+    The module is registered in ``sys.modules`` immediately but its body only
+    executes on first attribute access, so importing this module does not pay
+    the start-up cost of gRPC until a channel is actually created.
+
+    Raises:
+        ModuleNotFoundError: If the module is not installed.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+grpc = _lazy_import("grpc")
+reflection_pb2 = _lazy_import("grpc_reflection.v1alpha.reflection_pb2")
+reflection_pb2_grpc = _lazy_import("grpc_reflection.v1alpha.reflection_pb2_grpc")
+
+
+@functools.lru_cache(maxsize=128)
+def _is_private_target(target: str) -> bool:
+    """Check whether a host[:port] target is a private IP address.
+
+    Cached per process so clients reconnecting to the same target parse it
+    only once.
+    """
+    try:
+        # Extract IP from hostname:port
+        ip_str = target.split(':')[0]
+        ip = ipaddress.ip_address(ip_str)
+        return ip.is_private
+    except (ValueError, IndexError):
+        # Not a valid IP address, assume it's a hostname (remote)
+        return False
+
+
 class StarlinkConnectionError(Exception):
     """Raised when connection to Starlink device fails."""
     pass
@@ -72,14 +122,7 @@ class StarlinkClientV1:
 
     def _is_private_ip(self, hostname: str) -> bool:
         """Check if hostname is a private IP address."""
-        try:
-            # Extract IP from hostname:port
-            ip_str = hostname.split(':')[0]
-            ip = ipaddress.ip_address(ip_str)
-            return ip.is_private
-        except (ValueError, IndexError):
-            # Not a valid IP address, assume it's a hostname (remote)
-            return False
+        return _is_private_target(hostname)
 
     def connect(self) -> None:
         """Establish connection to the Starlink dish."""
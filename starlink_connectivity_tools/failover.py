@@ -41,7 +41,8 @@ class FailoverHandler:
         
         self._failure_count = 0
         self._current_state = ConnectionState.PRIMARY
-        self._last_check_time = 0.0
+        # Monotonic time of the last health check; -inf so the first runs at once
+        self._last_check_time = float("-inf")
         self._failover_history = []
         
         # Setup logging (applications should configure handlers)
@@ -54,7 +55,7 @@ class FailoverHandler:
         Returns:
             bool: True if failover should be initiated, False otherwise
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Check if enough time has passed since last check
         if current_time - self._last_check_time < self.check_interval:
@@ -175,7 +176,7 @@ class FailoverHandler:
         """
         self._failure_count = 0
         self._current_state = ConnectionState.PRIMARY
-        self._last_check_time = 0.0
+        self._last_check_time = float("-inf")
         if clear_history:
             self._failover_history = []
         self.logger.info("Failover handler reset to initial state")
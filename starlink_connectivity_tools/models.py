@@ -2,11 +2,20 @@
 Data models for Starlink connectivity tools.
 """
 
+import importlib.util
+import sys
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 from datetime import datetime
 from enum import Enum
 
+# Only looked up here: NumPy is imported by the first batch that uses it,
+# so importing the models does not pay NumPy's start-up cost
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+# Slotted models on Python 3.10+, where dataclass() accepts slots=True
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class AlertLevel(Enum):
     """Alert severity levels."""
@@ -25,7 +34,7 @@ class DeviceState(Enum):
     CONNECTED = "connected"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Alert:
     """Represents a device alert."""
     level: AlertLevel
@@ -35,7 +44,7 @@ class Alert:
     details: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DeviceStatus:
     """Current status of the Starlink device."""
     state: DeviceState
@@ -52,7 +61,7 @@ class DeviceStatus:
         return self.state == DeviceState.ONLINE and self.connected
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NetworkStats:
     """Network performance statistics."""
     download_mbps: float
@@ -71,9 +80,40 @@ class NetworkStats:
             self.latency_ms <= max_latency_ms and
             self.packet_loss_percent <= max_packet_loss
         )
-
-
-@dataclass
+    
+    @staticmethod
+    def is_healthy_batch(
+        latencies_ms: Sequence[float],
+        packet_losses_percent: Sequence[float],
+        max_latency_ms: float = 100,
+        max_packet_loss: float = 5.0,
+    ):
+        """
+        Apply the is_healthy() thresholds to a batch of samples.
+        
+        Args:
+            latencies_ms: Latency of each sample
+            packet_losses_percent: Packet loss of each sample, same length
+            max_latency_ms: Latency threshold
+            max_packet_loss: Packet loss threshold
+            
+        Returns:
+            Boolean mask with one entry per sample: a NumPy array when NumPy
+            is installed, otherwise a list
+        """
+        if NUMPY_AVAILABLE:
+            import numpy as np
+
+            return (np.asarray(latencies_ms) <= max_latency_ms) & (
+                np.asarray(packet_losses_percent) <= max_packet_loss
+            )
+        return [
+            latency <= max_latency_ms and loss <= max_packet_loss
+            for latency, loss in zip(latencies_ms, packet_losses_percent)
+        ]
+
+
+@dataclass(**_SLOTS)
 class TelemetryData:
     """Device telemetry including alerts, errors, and warnings."""
     alerts: List[Alert] = field(default_factory=list)
@@ -86,14 +126,16 @@ class TelemetryData:
     
     def has_critical_alerts(self) -> bool:
         """Check if there are any critical alerts."""
-        return any(alert.level == AlertLevel.CRITICAL for alert in self.alerts)
+        # Enum members are singletons, so identity avoids rich comparison
+        critical = AlertLevel.CRITICAL
+        return any(alert.level is critical for alert in self.alerts)
     
     def get_alerts_by_level(self, level: AlertLevel) -> List[Alert]:
         """Get all alerts of a specific level."""
-        return [alert for alert in self.alerts if alert.level == level]
+        return [alert for alert in self.alerts if alert.level is level]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DeviceLocation:
     """Device geographical location."""
     latitude: Optional[float] = None
@@ -107,7 +149,7 @@ class DeviceLocation:
         return self.latitude is not None and self.longitude is not None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WiFiClient:
     """Information about a connected WiFi client."""
     mac_address: str
@@ -117,7 +159,7 @@ class WiFiClient:
     connected_seconds: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WiFiStatus:
     """Current WiFi status and information."""
     ssid: str
@@ -133,7 +175,7 @@ class WiFiStatus:
         return len(self.connected_clients)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class WiFiConfig:
     """WiFi configuration settings."""
     ssid: Optional[str] = None
@@ -147,18 +189,14 @@ class WiFiConfig:
     
     def validate_ssid(self) -> bool:
         """Validate SSID length."""
-        if self.ssid is None:
-            return True
-        return 1 <= len(self.ssid) <= 32
+        return self.ssid is None or 1 <= len(self.ssid) <= 32
     
     def validate_password(self) -> bool:
         """Validate password length."""
-        if self.password is None:
-            return True
-        return 8 <= len(self.password) <= 63
+        return self.password is None or 8 <= len(self.password) <= 63
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DishConfig:
     """Dish configuration settings."""
     snow_melt_mode_enabled: Optional[bool] = None
@@ -171,7 +209,7 @@ class DishConfig:
         return self.power_save_mode_enabled is True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class AccountData:
     """Basic account information (remote only)."""
     service_line_number: Optional[str] = None
@@ -180,15 +218,20 @@ class AccountData:
     data_limit_gb: Optional[float] = None
     data_used_gb: Optional[float] = None
     
+    @property
+    def usage_percent(self) -> Optional[float]:
+        """Data used as a percentage of the limit, or None if either is unknown."""
+        if self.data_limit_gb is None or self.data_used_gb is None:
+            return None
+        return (self.data_used_gb / self.data_limit_gb) * 100
+    
     def is_near_limit(self, threshold_percent: float = 90.0) -> bool:
         """Check if data usage is near the limit."""
-        if self.data_limit_gb is None or self.data_used_gb is None:
-            return False
-        usage_percent = (self.data_used_gb / self.data_limit_gb) * 100
-        return usage_percent >= threshold_percent
+        usage_percent = self.usage_percent
+        return usage_percent is not None and usage_percent >= threshold_percent
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HistoricalData:
     """Historical data point for status and network stats."""
     timestamp: datetime
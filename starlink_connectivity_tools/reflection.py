@@ -10,6 +10,28 @@ from grpc_reflection.v1alpha import reflection_pb2, reflection_pb2_grpc
 from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
 from google.protobuf.descriptor import ServiceDescriptor, MethodDescriptor
 
+# FieldDescriptorProto.Type values to proto type names
+_FIELD_TYPES = {
+    1: 'double',
+    2: 'float',
+    3: 'int64',
+    4: 'uint64',
+    5: 'int32',
+    6: 'fixed64',
+    7: 'fixed32',
+    8: 'bool',
+    9: 'string',
+    10: 'group',
+    11: 'message',
+    12: 'bytes',
+    13: 'uint32',
+    14: 'enum',
+    15: 'sfixed32',
+    16: 'sfixed64',
+    17: 'sint32',
+    18: 'sint64',
+}
+
 
 class ProtoReflectionClient:
     """Client for extracting proto definitions using gRPC server reflection.
@@ -38,14 +60,13 @@ class ProtoReflectionClient:
         request = reflection_pb2.ServerReflectionRequest(list_services="")
         responses = self.stub.ServerReflectionInfo(iter([request]))
         
-        services = []
-        for response in responses:
-            if response.HasField('list_services_response'):
-                for service in response.list_services_response.service:
-                    services.append(service.name)
-                break
-        
-        return services
+        # Stop at the first listing rather than draining the stream
+        response = next(
+            (r for r in responses if r.HasField('list_services_response')), None
+        )
+        if response is None:
+            return []
+        return [service.name for service in response.list_services_response.service]
     
     def get_file_descriptor(self, symbol: str) -> descriptor_pb2.FileDescriptorProto:
         """Get file descriptor containing the specified symbol.
@@ -164,24 +185,7 @@ class ProtoReflectionClient:
         Returns:
             Field type as string.
         """
-        # Type mapping (simplified)
-        type_map = {
-            1: 'double',
-            2: 'float',
-            3: 'int64',
-            4: 'uint64',
-            5: 'int32',
-            6: 'fixed64',
-            7: 'fixed32',
-            8: 'bool',
-            9: 'string',
-            11: 'message',
-            12: 'bytes',
-            13: 'uint32',
-            14: 'enum',
-        }
-        
-        field_type = type_map.get(field.type, 'unknown')
+        field_type = _FIELD_TYPES.get(field.type, 'unknown')
         
         # For messages and enums, use the type name
         if field.type in (11, 14) and field.type_name:
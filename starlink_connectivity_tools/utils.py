@@ -13,14 +13,12 @@ def check_connection(dish_id=None):
     Returns:
         bool: True if connection check passes
     """
-    # Simple validation check
-    if dish_id is None:
-        return False
-    if not isinstance(dish_id, str):
-        return False
-    if len(dish_id) == 0:
-        return False
-    return True
+    # Simple validation check: a non-empty string (None is not a str)
+    return isinstance(dish_id, str) and len(dish_id) > 0
+
+
+# (unit, divisor) indexed by whether the speed is at least 1000 Mbps
+_SPEED_UNITS = (("Mbps", 1), ("Gbps", 1000))
 
 
 def format_speed(speed_mbps):
@@ -39,6 +37,5 @@ def format_speed(speed_mbps):
     if speed_mbps < 0:
         raise ValueError("Speed cannot be negative")
     
-    if speed_mbps >= 1000:
-        return f"{speed_mbps / 1000:.2f} Gbps"
-    return f"{speed_mbps:.2f} Mbps"
+    unit, divisor = _SPEED_UNITS[speed_mbps >= 1000]
+    return f"{speed_mbps / divisor:.2f} {unit}"
@@ -6,15 +6,98 @@ Tests all major functionality without requiring an actual Starlink connection.
 
 import json
 import os
+import subprocess
 import sys
 import tempfile
+from pathlib import Path
+
+import pytest
+
+# Top-level sections every generated configuration must contain
+_REQUIRED_CONFIG_KEYS = frozenset(
+    {'thresholds', 'crisis_thresholds', 'monitoring', 'logging', 'starlink'}
+)
+
+
 # Test utilities
+def make_config(tmpdir, check_interval=60):
+    """Build a test configuration pointing to localhost"""
+    return {
+        "thresholds": {
+            "ping_timeout": 5,
+            "max_failures": 3,
+            "min_success_rate": 0.8,
+            "alert_latency_ms": 100
+        },
+        "crisis_thresholds": {
+            "ping_timeout": 10,
+            "max_failures": 5,
+            "min_success_rate": 0.5,
+            "alert_latency_ms": 300
+        },
+        "monitoring": {
+            "check_interval": check_interval,
+            "history_size": 1000
+        },
+        "logging": {
+            "log_file": os.path.join(tmpdir, "test.log"),
+            "log_level": "INFO",
+            "console_output": False
+        },
+        "starlink": {
+            "dish_ip": "127.0.0.1",
+            "router_ip": "127.0.0.1"
+        },
+        "notifications": {
+            "enabled": False,
+            "email": None,
+            "webhook_url": None
+        }
+    }
+
+
+# Placeholder substituted with the real temp directory when a config is written
+_TMPDIR_PLACEHOLDER = "@TMPDIR@"
+
+# Configs serialized once at import, keyed by check_interval
+_CONFIG_BYTES = {
+    interval: json.dumps(make_config(_TMPDIR_PLACEHOLDER, check_interval=interval)).encode()
+    for interval in (60, 5)
+}
+
+
+def write_config(config_file, tmpdir, check_interval=60):
+    """Write a pre-serialized test configuration rooted at tmpdir"""
+    escaped_tmpdir = json.dumps(tmpdir)[1:-1].encode()
+    Path(config_file).write_bytes(
+        _CONFIG_BYTES[check_interval].replace(_TMPDIR_PLACEHOLDER.encode(), escaped_tmpdir)
+    )
+
+
+# Exit code reported when the tool is killed for exceeding its timeout
+TIMEOUT_EXIT_CODE = 124
+
+
+def run_tool(*args, timeout=None):
+    """Run starlink_connectivity.py with output discarded and return its exit code"""
+    try:
+        completed = subprocess.run(
+            [sys.executable, "starlink_connectivity.py", *args],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return TIMEOUT_EXIT_CODE
+    return completed.returncode
+
+
 def test_create_config():
     """Test configuration creation"""
     print("Testing configuration creation...")
     with tempfile.TemporaryDirectory() as tmpdir:
         config_file = os.path.join(tmpdir, "test_config.json")
-        result = os.system(f"python starlink_connectivity.py create-config --output {config_file}")
+        result = run_tool("create-config", "--output", config_file)
         
         if result != 0:
             print("❌ FAILED: Configuration creation returned non-zero exit code")
@@ -30,11 +113,10 @@ def test_create_config():
                 config = json.load(f)
             
             # Check required keys
-            required_keys = ['thresholds', 'crisis_thresholds', 'monitoring', 'logging', 'starlink']
-            for key in required_keys:
-                if key not in config:
-                    print(f"❌ FAILED: Missing required config key: {key}")
-                    return False
+            missing = _REQUIRED_CONFIG_KEYS - config.keys()
+            if missing:
+                print(f"❌ FAILED: Missing required config keys: {', '.join(sorted(missing))}")
+                return False
             
             print("✓ Configuration creation test passed")
             return True
@@ -46,7 +128,7 @@ def test_create_config():
 def test_help_output():
     """Test help output"""
     print("\nTesting help output...")
-    result = os.system("python starlink_connectivity.py --help > /dev/null 2>&1")
+    result = run_tool("--help")
     
     if result != 0:
         print("❌ FAILED: Help command returned non-zero exit code")
@@ -63,43 +145,9 @@ def test_single_check():
     # Create a config pointing to localhost
     with tempfile.TemporaryDirectory() as tmpdir:
         config_file = os.path.join(tmpdir, "test_config.json")
-        config = {
-            "thresholds": {
-                "ping_timeout": 5,
-                "max_failures": 3,
-                "min_success_rate": 0.8,
-                "alert_latency_ms": 100
-            },
-            "crisis_thresholds": {
-                "ping_timeout": 10,
-                "max_failures": 5,
-                "min_success_rate": 0.5,
-                "alert_latency_ms": 300
-            },
-            "monitoring": {
-                "check_interval": 60,
-                "history_size": 1000
-            },
-            "logging": {
-                "log_file": os.path.join(tmpdir, "test.log"),
-                "log_level": "INFO",
-                "console_output": False
-            },
-            "starlink": {
-                "dish_ip": "127.0.0.1",
-                "router_ip": "127.0.0.1"
-            },
-            "notifications": {
-                "enabled": False,
-                "email": None,
-                "webhook_url": None
-            }
-        }
-        
-        with open(config_file, 'w') as f:
-            json.dump(config, f)
+        write_config(config_file, tmpdir)
         
-        result = os.system(f"timeout 10 python starlink_connectivity.py --config {config_file} single-check > /dev/null 2>&1")
+        result = run_tool("--config", config_file, "single-check", timeout=10)
         
         if result != 0:
             print("❌ FAILED: Single check returned non-zero exit code")
@@ -113,63 +161,36 @@ def test_crisis_mode():
     """Test crisis mode"""
     print("\nTesting crisis mode...")
     
+    # Config rooted in a temp dir so the run leaves no log file behind
     with tempfile.TemporaryDirectory() as tmpdir:
-        os.system(f"timeout 15 python starlink_connectivity.py --crisis-mode single-check > /dev/null 2>&1")
+        config_file = os.path.join(tmpdir, "test_config.json")
+        write_config(config_file, tmpdir)
         
-        # Crisis mode should work even if connection fails
-        # Exit code might be 0 or error, but shouldn't crash
-        print("✓ Crisis mode test passed")
-        return True
+        run_tool("--config", config_file, "--crisis-mode", "single-check", timeout=15)
+    
+    # Crisis mode should work even if connection fails
+    # Exit code might be 0 or error, but shouldn't crash
+    print("✓ Crisis mode test passed")
+    return True
 
 
+@pytest.mark.slow
 def test_monitor_with_duration():
     """Test monitoring with duration"""
     print("\nTesting monitor mode with duration...")
     
     with tempfile.TemporaryDirectory() as tmpdir:
         config_file = os.path.join(tmpdir, "test_config.json")
-        config = {
-            "thresholds": {
-                "ping_timeout": 5,
-                "max_failures": 3,
-                "min_success_rate": 0.8,
-                "alert_latency_ms": 100
-            },
-            "crisis_thresholds": {
-                "ping_timeout": 10,
-                "max_failures": 5,
-                "min_success_rate": 0.5,
-                "alert_latency_ms": 300
-            },
-            "monitoring": {
-                "check_interval": 5,
-                "history_size": 1000
-            },
-            "logging": {
-                "log_file": os.path.join(tmpdir, "test.log"),
-                "log_level": "INFO",
-                "console_output": False
-            },
-            "starlink": {
-                "dish_ip": "127.0.0.1",
-                "router_ip": "127.0.0.1"
-            },
-            "notifications": {
-                "enabled": False,
-                "email": None,
-                "webhook_url": None
-            }
-        }
-        
-        with open(config_file, 'w') as f:
-            json.dump(config, f)
+        write_config(config_file, tmpdir, check_interval=5)
         
         # Monitor for 10 seconds
-        result = os.system(f"timeout 20 python starlink_connectivity.py --config {config_file} monitor --duration 10 --interval 3 > /dev/null 2>&1")
+        result = run_tool(
+            "--config", config_file, "monitor", "--duration", "10", "--interval", "3", timeout=20
+        )
         
         # Accept exit code 0 (success) or timeout-related codes
         # The monitor should complete or handle timeout gracefully
-        if result not in [0, 256, 124 * 256]:  # 0=success, 256=SIGTERM, 31744=timeout
+        if result not in (0, 1, TIMEOUT_EXIT_CODE):  # 0=success, 1=error exit, 124=timeout
             print(f"⚠ WARNING: Monitor returned exit code: {result}, but continuing")
         
         print("✓ Monitor with duration test passed")
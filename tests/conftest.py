@@ -1,9 +1,148 @@
 """Test configuration for pytest."""
 
+import importlib.util
 import pytest
 import sys
+import types
 from pathlib import Path
 
 # Add src directory to Python path
-src_path = Path(__file__).parent.parent / "src"
+root_path = Path(__file__).parent.parent
+src_path = root_path / "src"
 sys.path.insert(0, str(src_path))
+
+# Root-level packages (starlink_connectivity, cli, src) for every test module;
+# appended so the src/ package keeps precedence
+if str(root_path) not in sys.path:
+    sys.path.append(str(root_path))
+
+
+def _load_module(path, name):
+    """Load the Python file at path as a module called name."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_src_module(name):
+    """Load a standalone module of src/starlink_connectivity_tools from its file.
+
+    Under pytest's default import mode the root-level starlink_connectivity_tools
+    package shadows the src/ one, so modules that import nothing from the
+    package are loaded by path instead of by name.
+    """
+    path = src_path / "starlink_connectivity_tools" / f"{name}.py"
+    return _load_module(path, f"_src_{name}")
+
+
+def _load_tool(name):
+    """Load a script from tools/, which is not a package, from its file."""
+    return _load_module(root_path / "tools" / f"{name}.py", f"_tools_{name}")
+
+
+@pytest.fixture
+def heap():
+    """Empty PairingHeap."""
+    return _load_src_module("_pairing_heap").PairingHeap()
+
+
+@pytest.fixture
+def rw_lock():
+    """Unlocked ReadWriteLock."""
+    return _load_src_module("_rwlock").ReadWriteLock()
+
+
+@pytest.fixture
+def monitor_cli():
+    """The tools/starlink_monitor_cli.py report and export script."""
+    return _load_tool("starlink_monitor_cli")
+
+
+@pytest.fixture
+def dashboard(monkeypatch):
+    """The tools/connectivity_dashboard.py web dashboard."""
+    pytest.importorskip("flask")
+    # The dashboard puts the repository root first on sys.path on import
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    return _load_tool("connectivity_dashboard")
+
+
+class StubStarlinkClient:
+    """Stand-in for starlink_client.StarlinkClient reporting a healthy link."""
+
+    def __init__(self, host):
+        self.host = host
+        self.stats = types.SimpleNamespace(
+            download_speed=100.0, upload_speed=10.0, latency=40.0,
+            jitter=2.0, packet_loss=0.0,
+        )
+
+    def get_network_stats(self):
+        return self.stats
+
+    def get_telemetry(self):
+        return None
+
+
+@pytest.fixture
+def simple_monitor(monkeypatch):
+    """The tools/starlink_simple_monitor.py script over a stub starlink_client."""
+    pytest.importorskip("requests")
+    starlink_client = types.ModuleType("starlink_client")
+    starlink_client.StarlinkClient = StubStarlinkClient
+    monkeypatch.setitem(sys.modules, "starlink_client", starlink_client)
+    return _load_tool("starlink_simple_monitor")
+
+
+@pytest.fixture
+def manager():
+    """Empty SatelliteConnectionManager."""
+    # Imported lazily so collecting the root-package tests does not bind
+    # starlink_connectivity_tools to the src/ package
+    from starlink_connectivity_tools.satellite_connection_manager import (
+        SatelliteConnectionManager,
+    )
+
+    return SatelliteConnectionManager()
+
+
+@pytest.fixture(scope="session")
+def make_starlink():
+    """Factory adding a simulated Starlink connection at priority 100.
+
+    Returns the manager the connection was added to, creating a new one
+    when none is given.
+    """
+    from starlink_connectivity_tools.satellite_connection_manager import (
+        ConnectionType,
+        SatelliteConnectionManager,
+    )
+
+    def make(mgr=None):
+        if mgr is None:
+            mgr = SatelliteConnectionManager()
+        mgr.add_connection(
+            "Starlink", ConnectionType.STARLINK, priority=100, simulation_mode=True
+        )
+        return mgr
+
+    return make
+
+
+@pytest.fixture
+def starlink_manager(manager, make_starlink):
+    """Manager with a single simulated Starlink connection at priority 100."""
+    return make_starlink(manager)
+
+
+@pytest.fixture(scope="session")
+def reports_dir(tmp_path_factory):
+    """Directory shared by every test that writes a report or export file."""
+    return tmp_path_factory.mktemp("reports")
+
+
+@pytest.fixture
+def report_path(reports_dir, request):
+    """JSON file path in reports_dir unique to the requesting test."""
+    return reports_dir / f"{request.node.name}.json"
@@ -3,13 +3,8 @@ Unit tests for Starlink Monitor CLI
 """
 
 import unittest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from cli.starlink_cli import StarlinkCLI, setup_logging
 from src.starlink_monitor import StarlinkMetrics
 
@@ -37,6 +32,8 @@ class TestStarlinkCLI(unittest.TestCase):
         colored = self.cli.colorize(text, "red")
         self.assertIn(text, colored)
         self.assertIn("\033[91m", colored)
+        self.assertTrue(colored.startswith("\033[91m"))
+        self.assertTrue(colored.endswith("\033[0m"))
 
     def test_colorize_invalid_color(self):
         """Test colorization with invalid color"""
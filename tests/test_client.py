@@ -2,7 +2,11 @@
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from starlink_connectivity_tools.client import StarlinkDishClient
+from starlink_connectivity_tools.client import (
+    StarlinkClientV1,
+    StarlinkDishClient,
+    _is_private_target,
+)
 
 
 class TestStarlinkDishClient:
@@ -121,3 +125,14 @@ class TestStarlinkDishClient:
 
         with pytest.raises(NotImplementedError):
             client.set_configuration({})
+
+    def test_is_private_target_cached(self):
+        """Test private target detection and that results are cached."""
+        _is_private_target.cache_clear()
+        client = StarlinkClientV1()
+
+        assert client._is_private_ip("192.168.100.1:9200") is True
+        assert client._is_private_ip("8.8.8.8:9200") is False
+        assert client._is_private_ip("dish.starlink.com:443") is False
+        assert client._is_private_ip("192.168.100.1:9200") is True
+        assert _is_private_target.cache_info().hits == 1
@@ -1,101 +1,97 @@
 """Tests for satellite connection manager."""
 
+import threading
+
 import pytest
 from starlink_connectivity_tools.satellite_connection_manager import (
-    SatelliteConnectionManager,
     ConnectionType,
     ConnectionStatus,
+    SatelliteConnection,
 )
 
+# Bound once so tests avoid repeated enum attribute lookups
+STARLINK = ConnectionType.STARLINK
+IRIDIUM = ConnectionType.IRIDIUM
+INMARSAT = ConnectionType.INMARSAT
+
 
-def test_connection_manager_init():
+def test_connection_manager_init(manager):
     """Test ConnectionManager initialization."""
-    manager = SatelliteConnectionManager()
-    assert manager.connections == []
+    assert manager.connections == ()
     assert manager.active_connection is None
 
 
-def test_add_starlink_connection():
+def test_add_starlink_connection(manager, make_starlink):
     """Test adding a Starlink connection."""
-    manager = SatelliteConnectionManager()
-    conn = manager.add_connection(
-        "Test Starlink", ConnectionType.STARLINK, priority=100, simulation_mode=True
-    )
+    assert make_starlink(manager) is manager
 
-    assert conn is not None
-    assert conn.name == "Test Starlink"
-    assert conn.connection_type == ConnectionType.STARLINK
+    conn = manager.connections[0]
+    assert conn.name == "Starlink"
+    assert conn.connection_type == STARLINK
     assert conn.priority == 100
     assert len(manager.connections) == 1
 
 
-def test_add_multiple_connections():
-    """Test adding multiple connections."""
-    manager = SatelliteConnectionManager()
+def test_simulated_connection():
+    """Test creating a connection that uses simulated data."""
+    conn = SatelliteConnection.simulated("Sim", STARLINK, priority=10)
+
+    assert conn.priority == 10
+    assert conn.status == ConnectionStatus.DISCONNECTED
+    assert conn.api_client.simulation_mode is True
+    assert conn.api_client.context is None
+    assert conn.test_connection() is True
 
-    manager.add_connection(
-        "Starlink", ConnectionType.STARLINK, priority=100, simulation_mode=True
-    )
-    manager.add_connection("Iridium", ConnectionType.IRIDIUM, priority=50)
-    manager.add_connection("Inmarsat", ConnectionType.INMARSAT, priority=25)
 
-    assert len(manager.connections) == 3
+def test_add_multiple_connections(starlink_manager):
+    """Test adding multiple connections."""
+    starlink_manager.add_connection("Iridium", IRIDIUM, priority=50)
+    starlink_manager.add_connection("Inmarsat", INMARSAT, priority=25)
+
+    assert len(starlink_manager.connections) == 3
     # Should be sorted by priority
-    assert manager.connections[0].priority == 100
-    assert manager.connections[1].priority == 50
-    assert manager.connections[2].priority == 25
+    assert starlink_manager.connections[0].priority == 100
+    assert starlink_manager.connections[1].priority == 50
+    assert starlink_manager.connections[2].priority == 25
 
 
-def test_connect():
+def test_connect(starlink_manager):
     """Test establishing connection."""
-    manager = SatelliteConnectionManager()
-    manager.add_connection(
-        "Starlink", ConnectionType.STARLINK, priority=100, simulation_mode=True
-    )
-
-    result = manager.connect()
+    result = starlink_manager.connect()
     assert result is True
-    assert manager.active_connection is not None
-    assert manager.active_connection.name == "Starlink"
+    assert starlink_manager.active_connection is not None
+    assert starlink_manager.active_connection.name == "Starlink"
 
 
-def test_select_best_connection():
+def test_select_best_connection(starlink_manager):
     """Test selecting best available connection."""
-    manager = SatelliteConnectionManager()
-    manager.add_connection(
-        "Starlink", ConnectionType.STARLINK, priority=100, simulation_mode=True
-    )
-    manager.add_connection("Iridium", ConnectionType.IRIDIUM, priority=50)
+    starlink_manager.add_connection("Iridium", IRIDIUM, priority=50)
 
-    best = manager.select_best_connection()
+    best = starlink_manager.select_best_connection()
     assert best is not None
     assert best.name == "Starlink"
 
 
-def test_get_connection_stats():
+def test_get_connection_stats(starlink_manager):
     """Test getting connection statistics."""
-    manager = SatelliteConnectionManager()
-    manager.add_connection(
-        "Starlink", ConnectionType.STARLINK, priority=100, simulation_mode=True
-    )
-    manager.connect()
+    starlink_manager.connect()
 
-    stats = manager.get_connection_stats()
+    stats = starlink_manager.get_connection_stats()
     assert stats is not None
     assert "total_connections" in stats
     assert stats["total_connections"] == 1
     assert "connections" in stats
 
+    status = starlink_manager.connections[0].status
+    assert isinstance(status, ConnectionStatus)
+    assert stats["connections"]["Starlink"]["status"] == status.label
 
-def test_perform_health_check():
+
+def test_perform_health_check(starlink_manager):
     """Test health check."""
-    manager = SatelliteConnectionManager()
-    manager.add_connection(
-        "Starlink", ConnectionType.STARLINK, priority=100, simulation_mode=True
-    )
-    manager.connect()
+    starlink_manager.connect()
 
-    health = manager.perform_health_check()
+    health = starlink_manager.perform_health_check()
     assert health is not None
     assert "timestamp" in health
     assert "active_connection" in health
@@ -103,46 +99,67 @@ def test_perform_health_check():
     assert len(health["connections"]) == 1
 
 
-def test_failover():
+def test_failover(starlink_manager):
     """Test failover between connections."""
-    manager = SatelliteConnectionManager()
-
-    starlink = manager.add_connection(
-        "Starlink", ConnectionType.STARLINK, priority=100, simulation_mode=True
-    )
-    iridium = manager.add_connection("Iridium", ConnectionType.IRIDIUM, priority=50)
-
-    manager.connect()
-    assert manager.active_connection.name == "Starlink"
+    starlink = starlink_manager.connections[0]
+    iridium = starlink_manager.add_connection("Iridium", IRIDIUM, priority=50)
+    starlink_manager.connect()
+    assert starlink_manager.active_connection.name == "Starlink"
 
     # Simulate failures
     starlink.failure_count = 5
 
     # Check and failover
-    result = manager.check_and_failover()
+    result = starlink_manager.check_and_failover()
     # In simulation, Starlink should still work, so no failover
     # But if it did failover, it would switch to Iridium
 
 
-def test_close_all():
-    """Test closing all connections."""
-    manager = SatelliteConnectionManager()
-    manager.add_connection(
-        "Starlink", ConnectionType.STARLINK, priority=100, simulation_mode=True
-    )
+def test_failover_skips_tombstoned_connection(manager):
+    """Test that a failed-over connection is skipped until recovered."""
+    iridium = manager.add_connection("Iridium", IRIDIUM, priority=100)
+    inmarsat = manager.add_connection("Inmarsat", INMARSAT, priority=50)
     manager.connect()
 
+    iridium.failure_count = manager.failover_threshold
+    assert manager.check_and_failover() is True
+    assert manager.active_connection is inmarsat
+    assert manager.select_best_connection() is inmarsat
+    assert manager.connections == (iridium, inmarsat)
+
+    assert manager.auto_recover("Iridium") is True
+    assert manager.select_best_connection() is iridium
+
+
+def test_close_all(starlink_manager):
+    """Test closing all connections."""
+    starlink_manager.connect()
+
+    starlink_manager.close_all()
+    assert len(starlink_manager.connections) == 0
+    assert starlink_manager.active_connection is None
+
+
+def test_close_all_continues_after_close_error(manager):
+    """Test that one failing close does not stop the others."""
+    first = manager.add_connection("First", STARLINK, priority=2, simulation_mode=True)
+    second = manager.add_connection("Second", STARLINK, priority=1, simulation_mode=True)
+    closed = []
+
+    def failing_close():
+        raise OSError("close failed")
+
+    first.api_client.close = failing_close
+    second.api_client.close = lambda: closed.append("Second")
+
     manager.close_all()
-    assert len(manager.connections) == 0
-    assert manager.active_connection is None
+    assert closed == ["Second"]
+    assert manager.connections == ()
 
 
-def test_get_metrics():
+def test_get_metrics(starlink_manager):
     """Test getting connection metrics."""
-    manager = SatelliteConnectionManager()
-    conn = manager.add_connection(
-        "Starlink", ConnectionType.STARLINK, priority=100, simulation_mode=True
-    )
+    conn = starlink_manager.connections[0]
 
     metrics = conn.get_metrics()
     assert metrics is not None
@@ -150,72 +167,114 @@ def test_get_metrics():
     assert "downlink_mbps" in metrics
     assert "uplink_mbps" in metrics
 
+    # The same read-only view is refreshed in place on every call
+    assert conn.get_metrics() is metrics
+    with pytest.raises(TypeError):
+        metrics["latency_ms"] = 0
+
+
+def test_update_priority(starlink_manager):
+    """Test changing connection priorities reorders connections."""
+    starlink = starlink_manager.connections[0]
+    iridium = starlink_manager.add_connection("Iridium", IRIDIUM, priority=50)
+
+    starlink_manager.update_priority(iridium, 150)
+    assert starlink_manager.connections[0] is iridium
+    assert iridium.priority == 150
+
+    starlink_manager.update_priority(iridium, 10)
+    assert starlink_manager.connections == (starlink, iridium)
+    assert len(starlink_manager.connections) == 2
+
+
+def test_connections_snapshot(starlink_manager):
+    """Test connections is a cached read-only tuple until the order changes."""
+    connections = starlink_manager.connections
+    assert starlink_manager.connections is connections
+    with pytest.raises(AttributeError):
+        connections.append(None)
+
+    iridium = starlink_manager.add_connection("Iridium", IRIDIUM, priority=150)
+    assert starlink_manager.connections == (iridium, *connections)
+    starlink_manager.update_priority(iridium, 10)
+    assert starlink_manager.connections == (*connections, iridium)
+
+
+def test_update_priority_of_failed_connection_still_in_heap(manager):
+    """Test reprioritizing a failed-over connection not yet evicted from the heap."""
+    b = manager.add_connection("B", IRIDIUM, priority=50)
+    manager.add_connection("C", INMARSAT, priority=10)
+    manager.connect()
+    a = manager.add_connection("A", IRIDIUM, priority=100)
+
+    # A stays at the top, so the failed-over B is never evicted
+    b.failure_count = manager.failover_threshold
+    assert manager.check_and_failover() is True
+    assert manager.active_connection is a
+
+    manager.update_priority(b, 1000)
+    assert manager.auto_recover("B") is True
+    assert manager.select_best_connection() is b
+    assert manager.connections[0] is b
+
+
+def test_select_best_connection_tests_without_lock(manager, monkeypatch):
+    """Test that readers are not blocked while candidates are tested."""
+    iridium = manager.add_connection("Iridium", IRIDIUM, priority=10)
+    stats = []
+
+    def test_connection(connection):
+        reader = threading.Thread(
+            target=lambda: stats.append(manager.get_connection_stats())
+        )
+        reader.start()
+        reader.join(timeout=1)
+        return True
+
+    monkeypatch.setattr(SatelliteConnection, "test_connection", test_connection)
+
+    assert manager.connect() is True
+    assert manager.active_connection is iridium
+    assert len(stats) == 1
+
+
+def test_fail_back_to_recovered_connection(manager, monkeypatch):
+    """Test that a failed-over connection is used again once it recovers."""
+    starlink = manager.add_connection("Starlink", IRIDIUM, priority=100)
+    iridium = manager.add_connection("Iridium", INMARSAT, priority=50)
+    down = set()
+    monkeypatch.setattr(
+        SatelliteConnection, "test_connection", lambda conn: conn.name not in down
+    )
+    manager.connect()
+
+    down = {"Starlink"}
+    starlink.failure_count = manager.failover_threshold
+    assert manager.check_and_failover() is True
+    assert manager.active_connection is iridium
+
+    # Starlink recovers, then the backup link fails
+    down = {"Iridium"}
+    iridium.failure_count = manager.failover_threshold
+    assert manager.check_and_failover() is True
+    assert manager.active_connection is starlink
+    assert starlink.failure_count == 0
+    assert manager.select_best_connection() is starlink
+
+
+def test_single_connection_reconnects_after_failover(starlink_manager, monkeypatch):
+    """Test that a lone connection is not excluded for good by a failover."""
+    starlink = starlink_manager.connections[0]
+    down = {"Starlink"}
+    monkeypatch.setattr(
+        SatelliteConnection, "test_connection", lambda conn: conn.name not in down
+    )
+    starlink_manager.active_connection = starlink
+    starlink.failure_count = starlink_manager.failover_threshold
+
+    assert starlink_manager.check_and_failover() is False
+    assert starlink_manager.connect() is False
 
-"""
-Tests for ConnectionManager module.
-"""
-
-import unittest
-from src.connection_manager import ConnectionManager
-
-
-class TestConnectionManager(unittest.TestCase):
-    """Test cases for ConnectionManager class."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.manager = ConnectionManager()
-
-    def test_initialization(self):
-        """Test ConnectionManager initialization."""
-        self.assertIsNotNone(self.manager)
-        self.assertFalse(self.manager.connected)
-        self.assertEqual(self.manager.connection_status, "disconnected")
-
-    def test_initialization_with_config(self):
-        """Test ConnectionManager initialization with config."""
-        config = {"timeout": 30}
-        manager = ConnectionManager(config=config)
-        self.assertEqual(manager.config, config)
-
-    def test_connect(self):
-        """Test connection establishment."""
-        result = self.manager.connect()
-        self.assertTrue(result)
-        self.assertTrue(self.manager.connected)
-        self.assertEqual(self.manager.connection_status, "connected")
-
-    def test_disconnect(self):
-        """Test disconnection."""
-        self.manager.connect()
-        result = self.manager.disconnect()
-        self.assertTrue(result)
-        self.assertFalse(self.manager.connected)
-        self.assertEqual(self.manager.connection_status, "disconnected")
-
-    def test_get_status(self):
-        """Test getting connection status."""
-        status = self.manager.get_status()
-        self.assertIsInstance(status, dict)
-        self.assertIn("connected", status)
-        self.assertIn("status", status)
-        self.assertFalse(status["connected"])
-
-    def test_get_status_when_connected(self):
-        """Test getting status when connected."""
-        self.manager.connect()
-        status = self.manager.get_status()
-        self.assertTrue(status["connected"])
-        self.assertEqual(status["status"], "connected")
-
-    def test_reconnect(self):
-        """Test reconnection."""
-        self.manager.connect()
-        result = self.manager.reconnect()
-        self.assertTrue(result)
-        self.assertTrue(self.manager.connected)
-        self.assertEqual(self.manager.connection_status, "connected")
-
-
-if __name__ == "__main__":
-    unittest.main()
+    down = set()
+    assert starlink_manager.connect() is True
+    assert starlink_manager.active_connection is starlink
@@ -1,20 +1,22 @@
 """Tests for crisis monitor."""
 
+import json
+from datetime import datetime, timedelta
+
 import pytest
-from starlink_connectivity_tools.satellite_connection_manager import (
-    SatelliteConnectionManager,
-    ConnectionType,
-)
 from starlink_connectivity_tools.crisis_monitor import (
     CrisisMonitor,
+    Issue,
+    PerformanceHistory,
     ScenarioType,
     IssueType,
+    MonitorEvent,
+    OverallStatus,
 )
 
 
-def test_crisis_monitor_init():
+def test_crisis_monitor_init(manager):
     """Test CrisisMonitor initialization."""
-    manager = SatelliteConnectionManager()
     monitor = CrisisMonitor(manager, scenario=ScenarioType.NORMAL)
 
     assert monitor.scenario == ScenarioType.NORMAL
@@ -22,10 +24,8 @@ def test_crisis_monitor_init():
     assert monitor.auto_recovery_enabled is True
 
 
-def test_scenario_thresholds():
+def test_scenario_thresholds(manager):
     """Test different scenario thresholds."""
-    manager = SatelliteConnectionManager()
-
     normal = CrisisMonitor(manager, scenario=ScenarioType.NORMAL)
     assert normal.thresholds["max_latency_ms"] == 100
 
@@ -33,9 +33,22 @@ def test_scenario_thresholds():
     assert disaster.thresholds["max_latency_ms"] == 300
 
 
-def test_set_scenario():
+def test_scenario_thresholds_are_read_only(manager):
+    """Test that monitors cannot mutate the shared scenario presets."""
+    monitor = CrisisMonitor(manager, scenario=ScenarioType.NORMAL)
+
+    with pytest.raises(TypeError):
+        monitor.thresholds["max_latency_ms"] = 1
+
+    monitor.set_custom_thresholds({"max_latency_ms": 250})
+    with pytest.raises(TypeError):
+        monitor.thresholds["max_latency_ms"] = 1
+    normal = CrisisMonitor.SCENARIO_THRESHOLDS[ScenarioType.NORMAL]
+    assert normal["max_latency_ms"] == 100
+
+
+def test_set_scenario(manager):
     """Test changing scenario."""
-    manager = SatelliteConnectionManager()
     monitor = CrisisMonitor(manager, scenario=ScenarioType.NORMAL)
 
     monitor.set_scenario(ScenarioType.MEDICAL)
@@ -43,9 +56,8 @@ def test_set_scenario():
     assert monitor.thresholds["max_latency_ms"] == 150
 
 
-def test_set_custom_thresholds():
+def test_set_custom_thresholds(manager):
     """Test setting custom thresholds."""
-    manager = SatelliteConnectionManager()
     monitor = CrisisMonitor(manager)
 
     custom = {"max_latency_ms": 250, "min_downlink_mbps": 15}
@@ -56,15 +68,11 @@ def test_set_custom_thresholds():
     assert monitor.thresholds["min_downlink_mbps"] == 15
 
 
-def test_check_health():
+def test_check_health(starlink_manager):
     """Test health check."""
-    manager = SatelliteConnectionManager()
-    manager.add_connection(
-        "Starlink", ConnectionType.STARLINK, priority=100, simulation_mode=True
-    )
-    manager.connect()
+    starlink_manager.connect()
 
-    monitor = CrisisMonitor(manager, scenario=ScenarioType.NORMAL)
+    monitor = CrisisMonitor(starlink_manager, scenario=ScenarioType.NORMAL)
     health = monitor.check_health()
 
     assert health is not None
@@ -73,19 +81,14 @@ def test_check_health():
     assert "health" in health
 
 
-def test_performance_report():
+def test_performance_report(starlink_manager):
     """Test performance report generation."""
-    manager = SatelliteConnectionManager()
-    manager.add_connection(
-        "Starlink", ConnectionType.STARLINK, priority=100, simulation_mode=True
-    )
-    manager.connect()
+    starlink_manager.connect()
 
-    monitor = CrisisMonitor(manager)
+    monitor = CrisisMonitor(starlink_manager)
 
     # Collect some data
-    for _ in range(10):
-        monitor.check_health()
+    monitor.check_health_n(10)
 
     report = monitor.get_performance_report(hours=1)
 
@@ -94,26 +97,50 @@ def test_performance_report():
     assert report["samples"] >= 10
 
 
-def test_export_data(tmp_path):
-    """Test data export."""
-    manager = SatelliteConnectionManager()
-    manager.add_connection(
-        "Starlink", ConnectionType.STARLINK, priority=100, simulation_mode=True
+def test_performance_history_ring_buffer():
+    """Test that the history keeps only the newest samples in order."""
+    history = PerformanceHistory(maxlen=3)
+    for i in range(5):
+        history.append(1000 + i, f"conn{i}", {"latency_ms": 10 * i}, i)
+
+    assert len(history) == 3
+    recent = history.since(0)
+    assert history.columns["latency_ms"][recent].tolist() == [20, 30, 40]
+    records = history.to_records(history.since(1003))
+    assert [r["connection"] for r in records] == ["conn4"]
+
+
+def test_performance_history_extend_wraps():
+    """Test that a batch larger than the free space wraps around the buffer."""
+    history = PerformanceHistory(maxlen=4)
+    history.append(1000, "conn0", {"latency_ms": 0}, 0)
+    history.extend(
+        [(1001 + i, f"conn{i + 1}", {"latency_ms": 10 * (i + 1)}, i) for i in range(5)]
     )
-    manager.connect()
 
-    monitor = CrisisMonitor(manager)
+    assert len(history) == 4
+    recent = history.since(0)
+    assert history.columns["latency_ms"][recent].tolist() == [20, 30, 40, 50]
+    assert history.connections[recent].tolist() == ["conn2", "conn3", "conn4", "conn5"]
+
+
+def test_export_data(starlink_manager, report_path):
+    """Test data export."""
+    starlink_manager.connect()
+
+    monitor = CrisisMonitor(starlink_manager)
     monitor.check_health()
 
-    export_file = tmp_path / "test_export.json"
-    monitor.export_data(str(export_file), hours=1)
+    monitor.export_data(str(report_path), hours=1)
 
-    assert export_file.exists()
+    assert report_path.exists()
+    exported = json.loads(report_path.read_text())
+    sampled_at = datetime.fromisoformat(exported["performance_history"][0]["timestamp"])
+    assert abs(datetime.now() - sampled_at) < timedelta(minutes=1)
 
 
-def test_register_callback():
+def test_register_callback(manager):
     """Test callback registration."""
-    manager = SatelliteConnectionManager()
     monitor = CrisisMonitor(manager)
 
     called = []
@@ -122,14 +149,42 @@ def test_register_callback():
         called.append(data)
 
     monitor.register_callback("issue_detected", callback)
-    assert len(monitor.callbacks["issue_detected"]) == 1
+    monitor.register_callback(MonitorEvent.ISSUE_DETECTED, callback)
+    assert monitor.callbacks[MonitorEvent.ISSUE_DETECTED] == (callback, callback)
+    assert monitor.callbacks[MonitorEvent.ISSUE_RESOLVED] == ()
+
+    monitor._trigger_callbacks(MonitorEvent.ISSUE_DETECTED, "data")
+    assert called == ["data", "data"]
 
 
-def test_determine_overall_status():
+def test_determine_overall_status(manager):
     """Test overall status determination."""
-    manager = SatelliteConnectionManager()
     monitor = CrisisMonitor(manager)
 
     # No issues - should be healthy
     status = monitor._determine_overall_status()
-    assert status == "healthy"
+    assert status == OverallStatus.HEALTHY
+    assert status.label == "healthy"
+
+
+def test_overall_status_tracks_issue_severities(manager):
+    """Test that status follows issues as they are added and resolved."""
+    monitor = CrisisMonitor(manager)
+    monitor.auto_recovery_enabled = False
+    warning_types = [
+        IssueType.LOW_BANDWIDTH,
+        IssueType.OBSTRUCTION,
+        IssueType.SIGNAL_DEGRADATION,
+    ]
+
+    for issue_type in warning_types:
+        monitor._add_issue(Issue(issue_type, "warning", "test", datetime.now()))
+    assert monitor._determine_overall_status() == OverallStatus.DEGRADED
+
+    critical = Issue(IssueType.HIGH_LATENCY, "critical", "test", datetime.now())
+    monitor._add_issue(critical)
+    assert monitor._determine_overall_status() == OverallStatus.CRITICAL
+
+    monitor._deactivate_issue(critical)
+    monitor._deactivate_issue(monitor.active_issues[0])
+    assert monitor._determine_overall_status() == OverallStatus.WARNING
@@ -0,0 +1,115 @@
+"""Tests for the tools/connectivity_dashboard.py ASGI routing."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+testing = pytest.importorskip("asgiref.testing")
+
+
+class FakeSubsystem:
+    """Subsystem whose every method returns a small dict naming the method."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: {"method": name}
+
+
+@pytest.fixture
+def asgi_app(dashboard, monkeypatch):
+    """ASGI app over fake subsystems, streaming every 10 ms."""
+    monkeypatch.setattr(
+        dashboard,
+        "_build_components",
+        lambda: SimpleNamespace(
+            monitor=FakeSubsystem(),
+            connection_manager=FakeSubsystem(),
+            bandwidth_optimizer=FakeSubsystem(),
+            power_manager=FakeSubsystem(),
+            failover_handler=FakeSubsystem(),
+            diagnostics=FakeSubsystem(),
+            power_modes={},
+        ),
+    )
+    monkeypatch.setattr(dashboard, "STREAM_INTERVAL", 0.01)
+    return dashboard.create_asgi_app()
+
+
+def http_scope(path, method="GET"):
+    """Build the ASGI scope of a plain HTTP/1.1 request."""
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 50000),
+    }
+
+
+async def request(app, path, method="GET"):
+    """Send one request and return its status, headers and joined body."""
+    communicator = testing.ApplicationCommunicator(app, http_scope(path, method))
+    await communicator.send_input({"type": "http.request", "body": b""})
+    start = await communicator.receive_output(timeout=5)
+    body = b""
+    while True:
+        message = await communicator.receive_output(timeout=5)
+        body += message.get("body", b"")
+        if not message.get("more_body"):
+            break
+    await communicator.wait(timeout=5)
+    return start["status"], dict(start["headers"]), body
+
+
+def test_metrics_served_by_flask(asgi_app):
+    """Test /api/metrics goes through the Flask app."""
+    status, _, body = asyncio.run(request(asgi_app, "/api/metrics"))
+
+    assert status == 200
+    assert json.loads(body)["starlink"] == {"method": "get_current_metrics"}
+
+
+def test_stream_served_natively_until_disconnect(asgi_app):
+    """Test GET /api/stream streams events and stops when the client leaves."""
+
+    async def stream():
+        communicator = testing.ApplicationCommunicator(
+            asgi_app, http_scope("/api/stream")
+        )
+        await communicator.send_input({"type": "http.request", "body": b""})
+        start = await communicator.receive_output(timeout=5)
+        events = [await communicator.receive_output(timeout=5) for _ in range(2)]
+        await communicator.send_input({"type": "http.disconnect"})
+        await communicator.wait(timeout=5)
+        return start, events
+
+    start, events = asyncio.run(stream())
+
+    assert start["status"] == 200
+    assert (b"content-type", b"text/event-stream") in start["headers"]
+    for event in events:
+        assert event["more_body"] is True
+        assert event["body"].startswith(b"data: ")
+        assert event["body"].endswith(b"\n\n")
+
+
+def test_stream_other_methods_reach_flask(asgi_app):
+    """Test only GET /api/stream bypasses Flask, which rejects other methods."""
+    status, _, _ = asyncio.run(request(asgi_app, "/api/stream", method="POST"))
+
+    assert status == 405
+
+
+def test_unknown_path_reaches_flask(asgi_app):
+    """Test paths without a route fall through to Flask's 404."""
+    status, _, _ = asyncio.run(request(asgi_app, "/api/missing"))
+
+    assert status == 404
@@ -1,12 +1,24 @@
 """Unit tests for the FailoverHandler class."""
 
 import unittest
-import time
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 from starlink_connectivity_tools import FailoverHandler
 from starlink_connectivity_tools.failover import ConnectionState
 
 
+# Health check callbacks shared by the tests
+def healthy():
+    return True
+
+
+def unhealthy():
+    return False
+
+
+def raising_health_check():
+    raise Exception("Network error")
+
+
 class TestFailoverHandler(unittest.TestCase):
     """Test cases for FailoverHandler functionality."""
 
@@ -16,6 +28,19 @@ class TestFailoverHandler(unittest.TestCase):
             failure_threshold=3, check_interval=0.1  # Short interval for testing
         )
 
+        # Drive the handler's check interval from a fake clock
+        self._now = 0.0
+        clock = patch(
+            "starlink_connectivity_tools.failover.time.monotonic",
+            side_effect=lambda: self._now,
+        )
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def advance(self, seconds):
+        """Move the fake clock forward."""
+        self._now += seconds
+
     def test_initialization(self):
         """Test FailoverHandler initialization."""
         self.assertEqual(self.handler.failure_threshold, 3)
@@ -25,11 +50,11 @@ class TestFailoverHandler(unittest.TestCase):
 
     def test_should_failover_with_healthy_connection(self):
         """Test should_failover returns False when connection is healthy."""
-        # Mock health check to always return True (healthy)
-        self.handler.health_check_callback = Mock(return_value=True)
+        # Connection always reports healthy
+        self.handler.health_check_callback = healthy
 
         # Wait for check interval
-        time.sleep(0.15)
+        self.advance(0.15)
 
         # Should not trigger failover when connection is healthy
         self.assertFalse(self.handler.should_failover())
@@ -37,26 +62,26 @@ class TestFailoverHandler(unittest.TestCase):
 
     def test_should_failover_increments_failure_count(self):
         """Test failure count increments on unhealthy connection."""
-        # Mock health check to always return False (unhealthy)
-        self.handler.health_check_callback = Mock(return_value=False)
+        # Connection always reports unhealthy
+        self.handler.health_check_callback = unhealthy
 
         # Check multiple times
-        time.sleep(0.15)
+        self.advance(0.15)
         self.handler.should_failover()
         self.assertEqual(self.handler.get_failure_count(), 1)
 
-        time.sleep(0.15)
+        self.advance(0.15)
         self.handler.should_failover()
         self.assertEqual(self.handler.get_failure_count(), 2)
 
     def test_should_failover_triggers_at_threshold(self):
         """Test failover triggers when failure threshold is reached."""
-        # Mock health check to always return False
-        self.handler.health_check_callback = Mock(return_value=False)
+        # Connection always reports unhealthy
+        self.handler.health_check_callback = unhealthy
 
         # Trigger failures up to threshold
         for i in range(self.handler.failure_threshold):
-            time.sleep(0.15)
+            self.advance(0.15)
             result = self.handler.should_failover()
 
             if i < self.handler.failure_threshold - 1:
@@ -99,8 +124,8 @@ class TestFailoverHandler(unittest.TestCase):
     def test_reset_handler(self):
         """Test resetting the handler to initial state."""
         # Cause some failures
-        self.handler.health_check_callback = Mock(return_value=False)
-        time.sleep(0.15)
+        self.handler.health_check_callback = unhealthy
+        self.advance(0.15)
         self.handler.should_failover()
 
         # Perform failover
@@ -114,12 +139,10 @@ class TestFailoverHandler(unittest.TestCase):
 
     def test_health_check_callback_exception_handling(self):
         """Test that exceptions in health check callback are handled."""
-        # Mock health check to raise an exception
-        self.handler.health_check_callback = Mock(
-            side_effect=Exception("Network error")
-        )
+        # Health check raises an exception
+        self.handler.health_check_callback = raising_health_check
 
-        time.sleep(0.15)
+        self.advance(0.15)
         result = self.handler.should_failover()
 
         # Should treat exception as failure
@@ -127,10 +150,10 @@ class TestFailoverHandler(unittest.TestCase):
 
     def test_check_interval_respected(self):
         """Test that check interval is respected."""
-        self.handler.health_check_callback = Mock(return_value=False)
+        self.handler.health_check_callback = unhealthy
 
         # First check should work
-        time.sleep(0.15)
+        self.advance(0.15)
         self.handler.should_failover()
         first_count = self.handler.get_failure_count()
 
@@ -140,24 +163,24 @@ class TestFailoverHandler(unittest.TestCase):
         self.assertEqual(self.handler.get_failure_count(), first_count)
 
         # After waiting, check should work again
-        time.sleep(0.15)
+        self.advance(0.15)
         self.handler.should_failover()
         self.assertEqual(self.handler.get_failure_count(), first_count + 1)
 
     def test_failure_count_resets_on_recovery(self):
         """Test that failure count resets when connection recovers."""
         # Simulate failures
-        self.handler.health_check_callback = Mock(return_value=False)
-        time.sleep(0.15)
+        self.handler.health_check_callback = unhealthy
+        self.advance(0.15)
         self.handler.should_failover()
-        time.sleep(0.15)
+        self.advance(0.15)
         self.handler.should_failover()
 
         self.assertEqual(self.handler.get_failure_count(), 2)
 
         # Simulate recovery
-        self.handler.health_check_callback = Mock(return_value=True)
-        time.sleep(0.15)
+        self.handler.health_check_callback = healthy
+        self.advance(0.15)
         self.handler.should_failover()
 
         # Failure count should be reset
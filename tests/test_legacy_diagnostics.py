@@ -0,0 +1,264 @@
+"""Tests for the legacy diagnostics classes in src/diagnostics.py."""
+
+import pytest
+from src.diagnostics import (
+    ConnectivityDiagnostics,
+    Diagnostics,
+    StarlinkDiagnostics,
+)
+
+# ConnectivityDiagnostics.run_full_diagnostic does not yet build the
+# "summary" section
+summary_missing = pytest.mark.xfail(
+    reason="ConnectivityDiagnostics.run_full_diagnostic lacks a summary"
+)
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Skip the simulated waits in the legacy diagnostics."""
+    monkeypatch.setattr("src.diagnostics.time.sleep", lambda seconds: None)
+
+
+def test_diagnostics_init():
+    """Test Diagnostics initialization."""
+    diagnostics = Diagnostics()
+    assert diagnostics.starlink_endpoint == "192.168.100.1"
+    assert diagnostics.diagnostic_history == []
+
+
+def test_diagnostics_custom_endpoint():
+    """Test Diagnostics initialization with custom endpoint."""
+    diagnostics = Diagnostics(starlink_endpoint="10.0.0.1")
+    assert diagnostics.starlink_endpoint == "10.0.0.1"
+
+
+def test_run_full_diagnostic():
+    """Test running full diagnostic."""
+    diagnostics = Diagnostics()
+    result = diagnostics.run_full_diagnostic()
+
+    assert {
+        "timestamp",
+        "connectivity",
+        "starlink_status",
+        "network_performance",
+        "hardware_status",
+        "overall_health",
+    } <= result.keys()
+    assert len(diagnostics.diagnostic_history) == 1
+
+
+def test_get_diagnostic_report():
+    """Test diagnostic report generation."""
+    diagnostics = Diagnostics()
+    report = diagnostics.get_diagnostic_report()
+
+    assert isinstance(report, str)
+    assert "Starlink Connectivity Diagnostic Report" in report
+    assert "Overall Health" in report
+
+
+def test_get_troubleshooting_steps():
+    """Test troubleshooting steps generation."""
+    diagnostics = Diagnostics()
+    steps = diagnostics.get_troubleshooting_steps()
+
+    assert isinstance(steps, list)
+    assert len(steps) > 0
+
+
+def test_connectivity_diagnostics_init():
+    """Test ConnectivityDiagnostics initialization."""
+    diag = ConnectivityDiagnostics()
+    assert diag.diagnostic_history == []
+    assert diag.max_history == 100
+
+
+@summary_missing
+def test_connectivity_diagnostics_run_full():
+    """Test ConnectivityDiagnostics full diagnostic run."""
+    diag = ConnectivityDiagnostics()
+    result = diag.run_full_diagnostic()
+
+    assert {"timestamp", "tests", "summary"} <= result.keys()
+    assert len(diag.diagnostic_history) == 1
+
+
+def test_connectivity_diagnostics_get_history():
+    """Test getting diagnostic history."""
+    diag = ConnectivityDiagnostics()
+
+    for _ in range(5):
+        diag.run_full_diagnostic()
+
+    history = diag.get_diagnostic_history(limit=3)
+    assert len(history) == 3
+
+
+def test_connectivity_diagnostics_history_limit():
+    """Test diagnostic history limit enforcement."""
+    diag = ConnectivityDiagnostics()
+    diag.diagnostic_history.extend({"t": i} for i in range(110))
+
+    diag._enforce_history_limit()
+
+    assert len(diag.diagnostic_history) == diag.max_history
+    assert diag.diagnostic_history[-1] == {"t": 109}
+
+
+def test_connectivity_diagnostics_get_historical():
+    """Test getting historical diagnostics."""
+    diag = ConnectivityDiagnostics()
+    diag.run_full_diagnostic()
+
+    history = diag.get_historical_diagnostics(hours=24)
+    assert isinstance(history, list)
+
+
+@summary_missing
+def test_connectivity_diagnostics_health_report():
+    """Test health report generation."""
+    diag = ConnectivityDiagnostics()
+    diag.run_full_diagnostic()
+
+    report = diag.generate_health_report()
+
+    assert {
+        "current_status",
+        "health_over_last_24h",
+        "common_issues",
+        "timestamp",
+    } <= report.keys()
+
+
+def test_starlink_diagnostics_init():
+    """Test StarlinkDiagnostics initialization."""
+    diag = StarlinkDiagnostics()
+    assert diag.logs == []
+    assert diag.alerts == []
+    assert diag.test_results == []
+    assert diag.health_status == "unknown"
+
+
+def test_starlink_diagnostics_health_check():
+    """Test health check."""
+    diag = StarlinkDiagnostics()
+    result = diag.run_health_check()
+
+    assert {"status", "tests_passed", "tests_failed"} <= result.keys()
+    assert diag.health_status == result["status"]
+
+
+def test_starlink_diagnostics_connectivity_test():
+    """Test connectivity test."""
+    diag = StarlinkDiagnostics()
+    result = diag.test_connectivity()
+
+    assert result["test"] == "connectivity"
+    assert {"status", "latency"} <= result.keys()
+    assert len(diag.test_results) == 1
+
+
+def test_starlink_diagnostics_bandwidth_test():
+    """Test bandwidth test."""
+    diag = StarlinkDiagnostics()
+    result = diag.test_bandwidth()
+
+    assert result["test"] == "bandwidth"
+    assert {"download_speed", "upload_speed"} <= result.keys()
+
+
+def test_starlink_diagnostics_signal_strength():
+    """Test signal strength retrieval."""
+    diag = StarlinkDiagnostics()
+    result = diag.get_signal_strength()
+
+    assert {"signal_strength", "quality", "satellites_visible"} <= result.keys()
+
+
+def test_starlink_diagnostics_log_event():
+    """Test event logging."""
+    diag = StarlinkDiagnostics()
+    event = {"type": "test", "message": "Test event"}
+
+    diag.log_event(event)
+    assert len(diag.logs) == 1
+    assert diag.logs[0] == event
+
+
+def test_starlink_diagnostics_test_history():
+    """Test test history retrieval."""
+    diag = StarlinkDiagnostics()
+    diag.test_connectivity()
+    diag.test_bandwidth()
+
+    history = diag.get_test_history()
+    assert len(history) == 2
+
+
+def test_starlink_diagnostics_clear_history():
+    """Test clearing test history."""
+    diag = StarlinkDiagnostics()
+    diag.test_connectivity()
+
+    result = diag.clear_test_history()
+    assert result is True
+    assert len(diag.test_results) == 0
+
+
+def test_starlink_diagnostics_system_info():
+    """Test system info retrieval."""
+    diag = StarlinkDiagnostics()
+    diag.test_connectivity()
+
+    info = diag.get_system_info()
+
+    assert {"health_status", "total_tests_run"} <= info.keys()
+    assert info["total_tests_run"] == 1
+
+
+@pytest.fixture(scope="module")
+def diag():
+    """Diagnostics instance shared by the read-only check tests."""
+    return Diagnostics()
+
+
+@pytest.mark.parametrize(
+    "method,keys",
+    [
+        (
+            "check_connectivity",
+            {"router_reachable", "internet_accessible", "dns_working", "timestamp"},
+        ),
+        (
+            "check_starlink_status",
+            {
+                "dish_connected",
+                "satellites_visible",
+                "signal_quality",
+                "downlink_throughput_mbps",
+                "uplink_throughput_mbps",
+            },
+        ),
+        (
+            "check_network_performance",
+            {
+                "latency_ms",
+                "jitter_ms",
+                "packet_loss_percent",
+                "download_speed_mbps",
+                "upload_speed_mbps",
+            },
+        ),
+        ("check_hardware_status", {"dish_temperature", "dish_motors", "power_supply"}),
+        (
+            "get_obstruction_map",
+            {"has_obstructions", "obstruction_percentage", "recommended_action"},
+        ),
+        ("test_speed", {"download_mbps", "upload_mbps", "latency_ms", "server"}),
+    ],
+)
+def test_diagnostics_check_keys(diag, method, keys):
+    """Test that each Diagnostics check reports its expected keys."""
+    assert keys <= getattr(diag, method)().keys()
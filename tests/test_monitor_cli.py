@@ -0,0 +1,49 @@
+"""Tests for the tools/starlink_monitor_cli.py report and export script."""
+
+import json
+
+import pytest
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def cli(monitor_cli, request, monkeypatch):
+    """monitor_cli exporting through orjson, then through the json module."""
+    if request.param:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(monitor_cli, "ORJSON_AVAILABLE", request.param)
+    return monitor_cli
+
+
+def test_export_data_compact_by_default(cli, report_path):
+    """Test the default export is a single line without spaces."""
+    assert cli.export_data(str(report_path)) == 0
+
+    text = report_path.read_text()
+    assert "\n" not in text
+    assert ", " not in text and '": ' not in text
+    assert json.loads(text)["metrics"]["latency"] == []
+
+
+def test_export_data_pretty(cli, report_path):
+    """Test pretty=True indents the export by two spaces."""
+    assert cli.export_data(str(report_path), pretty=True) == 0
+
+    text = report_path.read_text()
+    assert '\n  "metrics": {\n    "latency": []' in text
+    assert json.loads(text)["metrics"]["uptime"] == []
+
+
+def test_export_data_missing_directory(cli, tmp_path):
+    """Test exporting into a missing directory fails with status 1."""
+    assert cli.export_data(str(tmp_path / "missing" / "out.json")) == 1
+
+
+def test_pretty_flag_reaches_export(monitor_cli, report_path, monkeypatch):
+    """Test the export command passes --pretty through to export_data."""
+    monkeypatch.setattr(
+        "sys.argv",
+        ["starlink_monitor_cli.py", "export", "--output", str(report_path), "--pretty"],
+    )
+
+    assert monitor_cli.main() == 0
+    assert report_path.read_text().startswith("{\n  ")
@@ -6,11 +6,6 @@ medical emergency communications.
 """
 
 import unittest
-import sys
-import os
-
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from starlink_connectivity import BandwidthOptimizer
 from starlink_connectivity.optimizer import BandwidthAllocation
@@ -136,11 +131,21 @@ class TestBandwidthOptimizer(unittest.TestCase):
         self.assertIn("conn2", all_allocations)
         self.assertIn("conn3", all_allocations)
 
+    def test_get_all_allocations_is_read_only_view(self):
+        """Test all allocations are returned as a live read-only view."""
+        all_allocations = self.optimizer.get_all_allocations()
+        self.optimizer.allocate_bandwidth("conn1", "dest1", 10.0)
+
+        self.assertIn("conn1", all_allocations)
+        with self.assertRaises(TypeError):
+            all_allocations["conn2"] = None
+
     def test_update_existing_allocation(self):
         """Test updating an existing allocation."""
         # Create initial allocation
         self.optimizer.allocate_bandwidth("conn1", "dest1", 20.0)
         self.assertEqual(self.optimizer.available_bandwidth, 80.0)
+        self.assertEqual(self.optimizer.get_allocated_bandwidth(), 20.0)
 
         # Update the same connection with different bandwidth
         updated = self.optimizer.allocate_bandwidth("conn1", "dest1", 30.0)
@@ -204,11 +209,45 @@ class TestBandwidthOptimizer(unittest.TestCase):
             a.allocated_bandwidth for a in self.optimizer.get_all_allocations().values()
         )
         self.assertEqual(total_allocated, 17.0)
+        self.assertEqual(self.optimizer.get_allocated_bandwidth(), total_allocated)
 
         # Release medical evacuation
         self.optimizer.release_bandwidth("medical_evac")
         self.assertEqual(len(self.optimizer.allocations), 2)
 
+    def test_release_grants_waiting_by_priority(self):
+        """Test released bandwidth goes to waiting allocations by priority."""
+        self.optimizer.allocate_bandwidth("bulk", "dest1", 95.0)
+        self.optimizer.allocate_bandwidth("sync", "dest2", 5.0)
+        low = self.optimizer.allocate_bandwidth("backup", "dest3", 10.0, priority=0)
+        high = self.optimizer.allocate_bandwidth(
+            "medical_evac", "medical.data", 10.0, priority=10
+        )
+        self.assertEqual(low.status, "queued")
+        self.assertEqual(high.status, "queued")
+
+        # Too little for both: only the higher priority is topped up
+        self.optimizer.release_bandwidth("sync")
+        self.assertEqual(high.allocated_bandwidth, 5.0)
+        self.assertEqual(high.status, "partial")
+        self.assertEqual(low.allocated_bandwidth, 0)
+
+        self.optimizer.release_bandwidth("bulk")
+        self.assertEqual(high.status, "allocated")
+        self.assertEqual(low.status, "allocated")
+        self.assertEqual(low.allocated_bandwidth, 10.0)
+        self.assertEqual(self.optimizer.available_bandwidth, 80.0)
+
+    def test_released_waiting_allocation_is_skipped(self):
+        """Test a waiting allocation released before being granted is dropped."""
+        self.optimizer.allocate_bandwidth("bulk", "dest1", 100.0)
+        self.optimizer.allocate_bandwidth("waiting", "dest2", 10.0)
+        self.optimizer.release_bandwidth("waiting")
+
+        self.optimizer.release_bandwidth("bulk")
+        self.assertEqual(self.optimizer.available_bandwidth, 100.0)
+        self.assertEqual(len(self.optimizer.allocations), 0)
+
 
 class TestBandwidthAllocation(unittest.TestCase):
     """Test cases for BandwidthAllocation class."""
@@ -225,6 +264,7 @@ class TestBandwidthAllocation(unittest.TestCase):
         self.assertEqual(allocation.allocated_bandwidth, 0.0)
         self.assertEqual(allocation.priority, 0)
         self.assertEqual(allocation.status, "pending")
+        self.assertFalse(hasattr(allocation, "__dict__"))
 
     def test_allocation_repr(self):
         """Test string representation of allocation."""
@@ -0,0 +1,53 @@
+"""Tests for the pairing heap used by the connection manager."""
+
+import random
+
+import pytest
+
+
+def test_empty_heap(heap):
+    """Test an empty heap."""
+    assert len(heap) == 0
+    assert not heap
+    assert heap.find_min() is None
+    assert heap.delete_min() is None
+
+
+def test_delete_min_returns_sorted_order(heap):
+    """Test that repeated delete_min yields keys in ascending order."""
+    keys = random.Random(42).sample(range(1000), 200)
+    for key in keys:
+        heap.insert(key, str(key))
+
+    assert len(heap) == 200
+    result = [heap.delete_min().key for _ in range(200)]
+    assert result == sorted(keys)
+    assert not heap
+
+
+def test_decrease_key_moves_node_to_root(heap):
+    """Test decreasing a key below the minimum."""
+    nodes = [heap.insert(key, key) for key in (5, 3, 8, 1, 9)]
+
+    heap.decrease_key(nodes[4], 0)
+    assert heap.find_min().value == 9
+    assert [heap.delete_min().key for _ in range(5)] == [0, 1, 3, 5, 8]
+
+
+def test_decrease_key_rejects_larger_key(heap):
+    """Test that decrease_key refuses to raise a key."""
+    node = heap.insert(5, "a")
+    with pytest.raises(ValueError):
+        heap.decrease_key(node, 6)
+
+
+def test_delete_arbitrary_node(heap):
+    """Test deleting nodes that are not the minimum."""
+    nodes = {key: heap.insert(key, key) for key in range(10)}
+    heap.delete_min()
+
+    heap.delete(nodes[4])
+    heap.delete(nodes[7])
+    assert len(heap) == 7
+    assert sorted(node.key for node in heap) == [1, 2, 3, 5, 6, 8, 9]
+    assert [heap.delete_min().key for _ in range(7)] == [1, 2, 3, 5, 6, 8, 9]
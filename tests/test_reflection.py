@@ -1,9 +1,15 @@
 """Unit tests for ProtoReflectionClient."""
 
+from collections import namedtuple
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from starlink_connectivity_tools.reflection import ProtoReflectionClient
 from google.protobuf import descriptor_pb2
+from grpc_reflection.v1alpha import reflection_pb2
+
+# Plain stand-in for a FieldDescriptorProto
+Field = namedtuple("Field", "type label type_name", defaults=("",))
 
 
 class TestProtoReflectionClient:
@@ -27,14 +33,14 @@ class TestProtoReflectionClient:
         mock_stub = Mock()
         mock_stub_class.return_value = mock_stub
 
-        # Mock response
-        mock_response = Mock()
-        mock_service = Mock()
-        mock_service.name = "SpaceX.API.Device.Device"
-        mock_response.list_services_response.service = [mock_service]
-        mock_response.HasField.return_value = True
-
-        mock_stub.ServerReflectionInfo.return_value = [mock_response]
+        response = reflection_pb2.ServerReflectionResponse(
+            list_services_response=reflection_pb2.ListServiceResponse(
+                service=[
+                    reflection_pb2.ServiceResponse(name="SpaceX.API.Device.Device")
+                ]
+            )
+        )
+        mock_stub.ServerReflectionInfo.return_value = [response]
 
         client = ProtoReflectionClient(mock_channel)
         services = client.list_services()
@@ -47,19 +53,14 @@ class TestProtoReflectionClient:
         mock_channel = Mock()
         client = ProtoReflectionClient(mock_channel)
 
-        # Test various field types
-        field = Mock()
-        field.type = 9  # string
-        field.label = 1  # optional
-        assert client._get_field_type(field) == "string"
-
-        field.type = 8  # bool
-        assert client._get_field_type(field) == "bool"
-
-        field.type = 3  # int64
-        assert client._get_field_type(field) == "int64"
+        # Test various field types (label 1 = optional)
+        assert client._get_field_type(Field(9, 1)) == "string"
+        assert client._get_field_type(Field(8, 1)) == "bool"
+        assert client._get_field_type(Field(3, 1)) == "int64"
+        assert client._get_field_type(Field(17, 1)) == "sint32"
 
         # Test repeated field
-        field.type = 9
-        field.label = 3  # repeated
-        assert client._get_field_type(field) == "repeated string"
+        assert client._get_field_type(Field(9, 3)) == "repeated string"
+
+        # Messages use their own type name
+        assert client._get_field_type(Field(11, 1, ".spacex.Request")) == "Request"
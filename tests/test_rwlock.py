@@ -0,0 +1,43 @@
+"""Tests for the readers-writer lock."""
+
+import threading
+
+
+def test_readers_share_lock(rw_lock):
+    """Test that several readers can hold the lock at once."""
+    barrier = threading.Barrier(3, timeout=5)
+    errors = []
+
+    def reader():
+        with rw_lock.read():
+            try:
+                # Every reader must be inside the lock for the barrier to pass
+                barrier.wait()
+            except threading.BrokenBarrierError as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+
+
+def test_writer_excludes_readers(rw_lock):
+    """Test that a reader waits for an active writer to release."""
+    events = []
+
+    def reader():
+        with rw_lock.read():
+            events.append("read")
+
+    with rw_lock.write():
+        thread = threading.Thread(target=reader)
+        thread.start()
+        thread.join(timeout=0.1)
+        events.append("write")
+
+    thread.join()
+    assert events == ["write", "read"]
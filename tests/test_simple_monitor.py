@@ -0,0 +1,200 @@
+"""Tests for the tools/starlink_simple_monitor.py standalone monitor."""
+
+import atexit
+import json
+import logging
+import time
+
+import pytest
+import requests
+
+
+@pytest.fixture
+def make_monitor(simple_monitor, tmp_path):
+    """Factory for monitors logging under tmp_path, stopped at teardown.
+
+    Keyword arguments are written to a config file for the monitor.
+    """
+    monitors = []
+
+    def make(log_name="monitor.log", **config):
+        config_file = tmp_path / f"config{len(monitors)}.json"
+        config_file.write_text(json.dumps(config))
+        monitor = simple_monitor.StarlinkSimpleMonitor(
+            log_file=str(tmp_path / log_name), config_file=str(config_file)
+        )
+        monitors.append(monitor)
+        return monitor
+
+    yield make
+
+    for monitor in monitors:
+        monitor.stop_monitoring()
+        stop_logging(monitor)
+
+
+def stop_logging(monitor):
+    """Flush a monitor's queued log records to its handlers."""
+    listener = monitor._log_listener
+    if listener is not None and listener._thread is not None:
+        atexit.unregister(listener.stop)
+        listener.stop()
+
+
+def sample(ts, download, upload, latency):
+    """Build one performance history entry."""
+    return {
+        "timestamp": "", "ts": ts, "download_speed": download,
+        "upload_speed": upload, "latency": latency,
+        "jitter": 0, "packet_loss": 0,
+    }
+
+
+def test_no_fast_checks_by_default(make_monitor):
+    """Test an issue does not shorten the delay unless fast checks are set."""
+    monitor = make_monitor(check_interval=60, min_download_speed=500)
+
+    assert monitor.run_single_check() is False
+    assert monitor._next_check_delay() == 60
+
+
+def test_fast_checks_after_issue(make_monitor):
+    """Test an issue switches to fast_check_interval within the window."""
+    monitor = make_monitor(
+        check_interval=60, fast_check_interval=5, fast_check_window=60
+    )
+    assert monitor.run_single_check() is True
+    assert monitor._next_check_delay() == 60
+
+    monitor.client.stats.download_speed = 1.0
+    assert monitor.run_single_check() is False
+    assert monitor._next_check_delay() == 5
+
+
+def test_fast_checks_end_with_window(make_monitor, simple_monitor, monkeypatch):
+    """Test the delay returns to check_interval once the window has passed."""
+    monitor = make_monitor(
+        check_interval=60, fast_check_interval=5, fast_check_window=30,
+        min_download_speed=500,
+    )
+    monitor.run_single_check()
+
+    later = time.monotonic() + 31
+    monkeypatch.setattr(simple_monitor.time, "monotonic", lambda: later)
+    assert monitor._next_check_delay() == 60
+
+
+def test_fast_check_delay_capped_at_check_interval(make_monitor):
+    """Test a fast_check_interval above check_interval never slows checks."""
+    monitor = make_monitor(
+        check_interval=30, fast_check_interval=120, min_download_speed=500
+    )
+
+    monitor.run_single_check()
+    assert monitor._next_check_delay() == 30
+
+
+@pytest.mark.parametrize("hours", [1, 24, 72])
+def test_numpy_and_fallback_reports_match(make_monitor, simple_monitor, monkeypatch, hours):
+    """Test the NumPy ring and the history fallback summarize the same samples."""
+    pytest.importorskip("numpy")
+    now = time.time()
+    samples = [
+        sample(now - age * 3600, download, upload, latency)
+        for age, download, upload, latency in [
+            (48, 1.5, 0.5, 900.0),
+            (12, 20.25, 3.0, 55.5),
+            (6, 150.0, 12.5, 31.0),
+            (0.5, 75.125, 8.0, 42.0),
+            (0.1, 80.0, 9.5, 38.25),
+        ]
+    ]
+
+    with_numpy = make_monitor()
+    monkeypatch.setattr(simple_monitor, "NUMPY_AVAILABLE", False)
+    fallback = make_monitor()
+    assert with_numpy._metric_rows is not None
+    assert fallback._metric_rows is None
+    for entry in samples:
+        with_numpy._store_performance_data(entry)
+        fallback._store_performance_data(entry)
+
+    expected = fallback.get_performance_report(hours=hours)
+    report = with_numpy.get_performance_report(hours=hours)
+    assert report["samples"] == expected["samples"]
+    for key in ("averages", "maximums", "minimums"):
+        assert report[key] == pytest.approx(expected[key])
+
+
+def test_reports_without_samples(make_monitor, simple_monitor, monkeypatch):
+    """Test both summaries report no_data when no sample is recent enough."""
+    entry = sample(time.time() - 48 * 3600, 10.0, 1.0, 50.0)
+    with_numpy = make_monitor()
+    monkeypatch.setattr(simple_monitor, "NUMPY_AVAILABLE", False)
+    fallback = make_monitor()
+    for monitor in (with_numpy, fallback):
+        monitor._store_performance_data(entry)
+        assert monitor.get_performance_report(hours=24) == {
+            "status": "no_data", "hours": 24,
+        }
+
+
+def test_webhook_failure_logged_not_raised(make_monitor, monkeypatch, caplog):
+    """Test a failing webhook is logged off the check path, not raised."""
+    def refuse(session, url, **kwargs):
+        raise requests.ConnectionError("connection refused")
+
+    monkeypatch.setattr(requests.Session, "post", refuse)
+    monitor = make_monitor(webhook_url="http://127.0.0.1:9/hook")
+    monitor.log.addHandler(caplog.handler)
+
+    monitor.send_notification("link down", "critical")
+    executor = monitor._webhook_executor
+    monitor.stop_monitoring()
+    executor.shutdown(wait=True)
+
+    assert monitor.alerts[-1]["message"] == "link down"
+    failures = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert [r.getMessage() for r in failures] == [
+        "Webhook notification failed: connection refused"
+    ]
+
+
+def test_stop_monitoring_releases_webhook_resources(make_monitor, monkeypatch):
+    """Test stopping delivers queued notifications, then closes the session."""
+    calls = []
+    monkeypatch.setattr(
+        requests.Session, "post",
+        lambda session, url, **kwargs: calls.append(("post", kwargs["json"]["message"])),
+    )
+    monkeypatch.setattr(requests.Session, "close", lambda session: calls.append("close"))
+    monitor = make_monitor(webhook_url="http://127.0.0.1:9/hook")
+
+    monitor.send_notification("link down", "critical")
+    executor = monitor._webhook_executor
+    monitor.stop_monitoring()
+    executor.shutdown(wait=True)
+
+    assert calls == [("post", "link down"), "close"]
+    assert monitor._webhook_executor is None
+    assert monitor._webhook_session is None
+    with pytest.raises(RuntimeError):
+        executor.submit(print)
+
+
+def test_monitors_log_to_their_own_files(make_monitor, tmp_path):
+    """Test monitors for one host with different log files keep them apart."""
+    first = make_monitor(log_name="first.log")
+    second = make_monitor(log_name="second.log")
+
+    first.log.info("from the first monitor")
+    second.log.info("from the second monitor")
+    stop_logging(first)
+    stop_logging(second)
+
+    first_log = (tmp_path / "first.log").read_text()
+    second_log = (tmp_path / "second.log").read_text()
+    assert "from the first monitor" in first_log
+    assert "from the second monitor" not in first_log
+    assert "from the second monitor" in second_log
+    assert "from the first monitor" not in second_log
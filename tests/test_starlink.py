@@ -1,5 +1,7 @@
 """Tests for Starlink connectivity tools."""
 
+import sys
+
 import pytest
 from datetime import datetime
 from starlink_connectivity_tools import (
@@ -61,6 +63,28 @@ class TestDataModels:
         )
         assert bad_stats.is_healthy() is False
 
+    def test_network_stats_is_healthy_batch(self):
+        """Test NetworkStats.is_healthy_batch() matches is_healthy()."""
+        latencies = [50.0, 150.0, 100.0, 20.0]
+        losses = [1.0, 1.0, 5.0, 10.0]
+
+        mask = NetworkStats.is_healthy_batch(latencies, losses)
+        assert list(mask) == [True, False, True, False]
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need 3.10+")
+    def test_models_are_slotted(self):
+        """Test data models do not carry a per-instance __dict__."""
+        stats = NetworkStats(
+            download_mbps=100.0,
+            upload_mbps=20.0,
+            latency_ms=50.0,
+            packet_loss_percent=1.0,
+            timestamp=datetime.now(),
+        )
+        assert not hasattr(stats, "__dict__")
+        assert not hasattr(TelemetryData(), "__dict__")
+        assert TelemetryData().alerts == []
+
     def test_telemetry_has_critical_alerts(self):
         """Test TelemetryData.has_critical_alerts() method."""
         critical_alert = Alert(
@@ -135,6 +159,16 @@ class TestDataModels:
         )
         assert account_safe.is_near_limit() is False
 
+    def test_account_data_usage_percent(self):
+        """Test AccountData.usage_percent property."""
+        account = AccountData(data_limit_gb=200.0, data_used_gb=50.0)
+        assert account.usage_percent == 25.0
+
+        account.data_used_gb = 150.0
+        assert account.usage_percent == 75.0
+        assert AccountData(data_limit_gb=100.0).usage_percent is None
+        assert AccountData(data_limit_gb=100.0).is_near_limit() is False
+
 
 class TestStarlinkClient:
     """Test StarlinkClient functionality."""
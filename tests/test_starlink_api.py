@@ -60,6 +60,8 @@ def test_get_history_simulation():
     assert "pop_ping_latency_ms" in history
     assert "downlink_throughput_bps" in history
     assert len(history["pop_ping_latency_ms"]) == 100
+    assert len(history["snr"]) == 100
+    assert type(history["downlink_throughput_bps"][0]) is float
 
 
 def test_parse_state():
@@ -71,6 +73,8 @@ def test_parse_state():
     assert api._parse_state(2) == "STOWED"
     assert api._parse_state(3) == "SEARCHING"
     assert api._parse_state(4) == "CONNECTED"
+    assert api._parse_state(5) == "UNKNOWN_5"
+    assert api._parse_state(-1) == "UNKNOWN_-1"
 
 
 def test_parse_alerts():
@@ -87,6 +91,13 @@ def test_parse_alerts():
     assert "MOTORS_STUCK" in alerts
     assert "THERMAL_THROTTLE" in alerts
 
+    assert api._parse_alerts(0) == []
+    # Bits beyond the known alerts are ignored
+    assert api._parse_alerts(32 | 64 | 4) == [
+        "THERMAL_SHUTDOWN",
+        "SOFTWARE_INSTALL_PENDING",
+    ]
+
 
 def test_close():
     """Test closing API connection."""
@@ -7,39 +7,130 @@ Provides a user-friendly interface for real-time monitoring and control.
 """
 
 import sys
+import asyncio
+import gzip
 import json
+import hashlib
+import threading
+import time
 from datetime import datetime
-from typing import Dict, Any
+from types import SimpleNamespace
+from typing import Dict, Any, Optional
 from pathlib import Path
 
 # Add parent directory to path to import src modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from src.starlink_monitor import StarlinkMonitor
-from src.connection_manager import ConnectionManager
-from src.bandwidth_optimizer import BandwidthOptimizer
-from src.power_manager import PowerManager, PowerMode
-from src.failover_handler import FailoverHandler
-from src.diagnostics import Diagnostics
-from src.config.settings import Settings
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 try:
-    from flask import Flask, render_template_string, jsonify, request
+    from flask import Flask, Response, jsonify, request
     FLASK_AVAILABLE = True
 except ImportError:
     FLASK_AVAILABLE = False
     print("Warning: Flask not installed. Web dashboard requires Flask.")
     print("Install with: pip install flask")
 
-app = Flask(__name__)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from asgiref.wsgi import WsgiToAsgi
+    ASGIREF_AVAILABLE = True
+except ImportError:
+    ASGIREF_AVAILABLE = False
+
+try:
+    import uvicorn
+    UVICORN_AVAILABLE = True
+except ImportError:
+    UVICORN_AVAILABLE = False
+
+_components: Optional[SimpleNamespace] = None
+_components_lock = threading.Lock()
+
+
+def _build_components() -> SimpleNamespace:
+    """Import and construct the dashboard's subsystems."""
+    from src.starlink_monitor import StarlinkMonitor
+    from src.connection_manager import ConnectionManager
+    from src.bandwidth_optimizer import BandwidthOptimizer
+    from src.power_manager import PowerManager, PowerMode
+    from src.failover_handler import FailoverHandler
+    from src.diagnostics import Diagnostics
+
+    return SimpleNamespace(
+        monitor=StarlinkMonitor(),
+        connection_manager=ConnectionManager(),
+        bandwidth_optimizer=BandwidthOptimizer(),
+        power_manager=PowerManager(),
+        failover_handler=FailoverHandler(),
+        diagnostics=Diagnostics(),
+        # Power modes accepted by the API, keyed by lowercase name
+        power_modes={mode.name.lower(): mode for mode in PowerMode},
+    )
+
+
+def get_components() -> SimpleNamespace:
+    """
+    Return the dashboard's subsystems, creating them on first use.
+    
+    Deferred so that --help and a missing Flask do not import or start the
+    monitoring stack. The lock ensures concurrent first requests share one
+    set of components.
+    """
+    global _components
+    if _components is None:
+        with _components_lock:
+            if _components is None:
+                _components = _build_components()
+    return _components
+
+
+# Seconds a /api/metrics payload is shared between concurrent pollers
+METRICS_TTL = 1.0
+
+# Seconds between /api/stream events
+STREAM_INTERVAL = 1.0
+
+# Events per /api/stream response; EventSource reconnects when it ends
+STREAM_MAX_EVENTS = 300
+
+_metrics_payload: Optional[Dict[str, Any]] = None
+_metrics_expires = 0.0
+_metrics_lock = threading.Lock()
+
+
+def _metrics_snapshot() -> Dict[str, Any]:
+    """
+    Return the /api/metrics payload, rebuilt at most once per METRICS_TTL.
+    
+    The lock is held while rebuilding, so pollers arriving meanwhile wait
+    for that one build instead of querying every subsystem themselves.
+    """
+    global _metrics_payload, _metrics_expires
+    with _metrics_lock:
+        now = time.monotonic()
+        if _metrics_payload is None or now >= _metrics_expires:
+            components = get_components()
+            _metrics_payload = {
+                'timestamp': datetime.now().isoformat(),
+                'starlink': components.monitor.get_current_metrics(),
+                'connection': components.connection_manager.get_status(),
+                'bandwidth': components.bandwidth_optimizer.get_current_usage(),
+                'power': components.power_manager.get_power_status(),
+                'failover': components.failover_handler.get_status(),
+            }
+            _metrics_expires = now + METRICS_TTL
+        return _metrics_payload
+
 
-# Initialize components
-monitor = StarlinkMonitor()
-connection_manager = ConnectionManager()
-bandwidth_optimizer = BandwidthOptimizer()
-power_manager = PowerManager()
-failover_handler = FailoverHandler()
-diagnostics = Diagnostics()
+def _invalidate_metrics() -> None:
+    """Make the next /api/metrics request rebuild its payload."""
+    global _metrics_expires
+    with _metrics_lock:
+        _metrics_expires = 0.0
 
 
 # HTML Template for dashboard
@@ -160,6 +251,12 @@ DASHBOARD_TEMPLATE = """
                 .catch(error => console.error('Error fetching data:', error));
         }
         
+        function startStream() {
+            // One long-lived connection; EventSource reconnects on its own
+            const source = new EventSource('/api/stream');
+            source.onmessage = e => updateDashboard(JSON.parse(e.data));
+        }
+        
         function updateDashboard(data) {
             document.getElementById('last-update').textContent = 
                 'Last update: ' + new Date().toLocaleTimeString();
@@ -168,11 +265,14 @@ DASHBOARD_TEMPLATE = """
             console.log('Dashboard updated', data);
         }
         
-        // Auto-refresh every 5 seconds
-        setInterval(refreshData, 5000);
-        
-        // Initial load
-        window.onload = refreshData;
+        // Live updates over Server-Sent Events, polling every 5 seconds
+        // on browsers without EventSource
+        if (window.EventSource) {
+            window.onload = startStream;
+        } else {
+            setInterval(refreshData, 5000);
+            window.onload = refreshData;
+        }
     </script>
 </head>
 <body>
@@ -277,74 +377,211 @@ DASHBOARD_TEMPLATE = """
 """
 
 
-@app.route('/')
+def _minify_html(html: str) -> str:
+    """Drop indentation and blank lines, keeping newlines for the inline JS."""
+    return '\n'.join(line.strip() for line in html.splitlines() if line.strip())
+
+
+def _etag(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+# The page has no template variables, so it is minified, compressed and
+# hashed once; mtime=0 keeps the gzip bytes (and ETag) stable across restarts
+DASHBOARD_HTML = _minify_html(DASHBOARD_TEMPLATE).encode('utf-8')
+DASHBOARD_HTML_GZIP = gzip.compress(DASHBOARD_HTML, compresslevel=9, mtime=0)
+DASHBOARD_ETAG = _etag(DASHBOARD_HTML)
+DASHBOARD_GZIP_ETAG = _etag(DASHBOARD_HTML_GZIP)
+
+
+def json_bytes(payload) -> bytes:
+    """Serialize a payload to JSON bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            payload,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(payload, default=str).encode('utf-8')
+
+
+def json_response(payload, status=200):
+    """Serialize an API payload, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return Response(json_bytes(payload), status=status, mimetype='application/json')
+    return jsonify(payload), status
+
+
+def _metrics_event() -> bytes:
+    """Encode the shared metrics snapshot as one Server-Sent Event."""
+    return b'data: ' + json_bytes(_metrics_snapshot()) + b'\n\n'
+
+
+def _metrics_events():
+    """Yield STREAM_MAX_EVENTS metrics events, one per interval."""
+    for i in range(STREAM_MAX_EVENTS):
+        if i:
+            time.sleep(STREAM_INTERVAL)
+        yield _metrics_event()
+
+
+STREAM_HEADERS = [
+    (b'content-type', b'text/event-stream'),
+    (b'cache-control', b'no-cache'),
+    # Keep reverse proxies such as nginx from buffering the stream
+    (b'x-accel-buffering', b'no'),
+]
+
+
+async def _stream_metrics_asgi(receive, send):
+    """
+    Serve /api/stream natively under ASGI.
+    
+    WsgiToAsgi runs every WSGI call on one shared thread, so a WSGI stream
+    would block all other requests for as long as a page stays open. Here
+    the wait between events is async and the stream stops as soon as the
+    client disconnects.
+    """
+    disconnected = asyncio.Event()
+    
+    async def watch_disconnect():
+        while (await receive())['type'] != 'http.disconnect':
+            pass
+        disconnected.set()
+    
+    watcher = asyncio.ensure_future(watch_disconnect())
+    loop = asyncio.get_running_loop()
+    try:
+        await send({'type': 'http.response.start', 'status': 200,
+                    'headers': STREAM_HEADERS})
+        for _ in range(STREAM_MAX_EVENTS):
+            # Snapshot rebuilds query the subsystems, so keep them off the loop
+            event = await loop.run_in_executor(None, _metrics_event)
+            if disconnected.is_set():
+                return
+            await send({'type': 'http.response.body', 'body': event,
+                        'more_body': True})
+            try:
+                await asyncio.wait_for(disconnected.wait(), STREAM_INTERVAL)
+                return
+            except asyncio.TimeoutError:
+                pass
+        await send({'type': 'http.response.body', 'body': b''})
+    finally:
+        watcher.cancel()
+
+
 def index():
     """Serve the main dashboard."""
-    return render_template_string(DASHBOARD_TEMPLATE)
+    if request.accept_encodings['gzip']:
+        response = Response(DASHBOARD_HTML_GZIP, mimetype='text/html')
+        response.content_encoding = 'gzip'
+        response.set_etag(DASHBOARD_GZIP_ETAG)
+    else:
+        response = Response(DASHBOARD_HTML, mimetype='text/html')
+        response.set_etag(DASHBOARD_ETAG)
+    response.vary.add('Accept-Encoding')
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    # Answers a matching If-None-Match with 304 Not Modified
+    return response.make_conditional(request)
 
 
-@app.route('/api/metrics')
 def get_metrics():
     """Get current metrics as JSON."""
-    metrics = monitor.get_current_metrics()
-    connection_status = connection_manager.get_status()
-    bandwidth_usage = bandwidth_optimizer.get_current_usage()
-    power_status = power_manager.get_power_status()
-    failover_status = failover_handler.get_status()
-    
-    return jsonify({
-        'timestamp': datetime.now().isoformat(),
-        'starlink': metrics,
-        'connection': connection_status,
-        'bandwidth': bandwidth_usage,
-        'power': power_status,
-        'failover': failover_status
-    })
+    return json_response(_metrics_snapshot())
+
+
+def stream_metrics():
+    """Stream metrics to the dashboard as Server-Sent Events."""
+    response = Response(_metrics_events(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    # Keep reverse proxies such as nginx from buffering the stream
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
 
 
-@app.route('/api/alerts')
 def get_alerts():
     """Get current alerts."""
-    alerts = monitor.check_alerts()
-    return jsonify({'alerts': alerts})
+    alerts = get_components().monitor.check_alerts()
+    return json_response({'alerts': alerts})
 
 
-@app.route('/api/diagnostics', methods=['POST'])
 def run_diagnostics():
     """Run diagnostics."""
-    report = diagnostics.run_full_diagnostic()
-    return jsonify(report)
+    report = get_components().diagnostics.run_full_diagnostic()
+    return json_response(report)
 
 
-@app.route('/api/power/mode', methods=['POST'])
 def set_power_mode():
     """Set power mode."""
     data = request.get_json()
     mode_str = data.get('mode', 'normal')
+    components = get_components()
     
-    try:
-        mode = PowerMode[mode_str.upper()]
-        success = power_manager.set_power_mode(mode)
-        return jsonify({'success': success, 'mode': mode_str})
-    except KeyError:
-        return jsonify({'success': False, 'error': 'Invalid power mode'}), 400
+    if isinstance(mode_str, str):
+        mode = components.power_modes.get(mode_str.lower())
+    else:
+        mode = None
+    if mode is None:
+        return json_response({'success': False, 'error': 'Invalid power mode'}, 400)
+    
+    success = components.power_manager.set_power_mode(mode)
+    _invalidate_metrics()
+    return json_response({'success': success, 'mode': mode_str})
 
 
-@app.route('/api/bandwidth/profile', methods=['POST'])
 def set_bandwidth_profile():
     """Set bandwidth profile."""
     data = request.get_json()
     profile = data.get('profile', 'normal')
     
-    success = bandwidth_optimizer.set_profile(profile)
-    return jsonify({'success': success, 'profile': profile})
+    success = get_components().bandwidth_optimizer.set_profile(profile)
+    _invalidate_metrics()
+    return json_response({'success': success, 'profile': profile})
 
 
-@app.route('/api/failover/test', methods=['POST'])
 def test_failover():
     """Test failover mechanism."""
+    failover_handler = get_components().failover_handler
     result = failover_handler.initiate_failover()
-    return jsonify({'success': result, 'status': failover_handler.get_status()})
+    _invalidate_metrics()
+    return json_response({'success': result, 'status': failover_handler.get_status()})
+
+
+def create_app() -> 'Flask':
+    """Create the dashboard's Flask application."""
+    app = Flask(__name__)
+    app.add_url_rule('/', view_func=index)
+    app.add_url_rule('/api/metrics', view_func=get_metrics)
+    app.add_url_rule('/api/stream', view_func=stream_metrics)
+    app.add_url_rule('/api/alerts', view_func=get_alerts)
+    app.add_url_rule('/api/diagnostics', view_func=run_diagnostics, methods=['POST'])
+    app.add_url_rule('/api/power/mode', view_func=set_power_mode, methods=['POST'])
+    app.add_url_rule('/api/bandwidth/profile', view_func=set_bandwidth_profile,
+                     methods=['POST'])
+    app.add_url_rule('/api/failover/test', view_func=test_failover, methods=['POST'])
+    return app
+
+
+def create_asgi_app():
+    """
+    Create the ASGI application for uvicorn.
+    
+    The monitoring state (components, metrics cache, alerts) lives in this
+    process, so the app must be served by a single uvicorn worker.
+    """
+    wsgi_app = WsgiToAsgi(create_app())
+    
+    async def asgi_app(scope, receive, send):
+        """Serve /api/stream natively and everything else through Flask."""
+        if (scope['type'] == 'http' and scope['method'] == 'GET'
+                and scope['path'] == '/api/stream'):
+            await _stream_metrics_asgi(receive, send)
+        else:
+            await wsgi_app(scope, receive, send)
+    
+    return asgi_app
 
 
 def main():
@@ -386,7 +623,19 @@ def main():
     print(f"🔧 API Base URL: http://{args.host}:{args.port}/api")
     print(f"\nPress Ctrl+C to stop\n")
     
-    app.run(host=args.host, port=args.port, debug=args.debug)
+    if UVICORN_AVAILABLE and ASGIREF_AVAILABLE and not args.debug:
+        # uvloop and httptools are picked up automatically when installed.
+        # One worker only: separate processes would each poll the dish and
+        # keep their own power mode, profile and alerts.
+        uvicorn.run(
+            create_asgi_app(),
+            host=args.host,
+            port=args.port,
+            log_level='warning',
+        )
+    else:
+        # Werkzeug development server (also used for its debugger)
+        create_app().run(host=args.host, port=args.port, debug=args.debug)
 
 
 if __name__ == "__main__":
@@ -15,13 +15,23 @@ python starlink_simple_monitor.py [--host 192.168.100.1] [--interval 60] [--min-
 
 import time
 import json
+import atexit
 import logging
+import logging.handlers
 import argparse
+import functools
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, Optional, List
 import threading
+from collections import deque
+from queue import Queue
+from itertools import islice, takewhile
+
+import requests
 
 try:
     from starlink_client import StarlinkClient
@@ -32,6 +42,28 @@ except ImportError:
     print("Install with: pip install starlink-client")
     sys.exit(1)
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Sample fields summarised in performance reports
+REPORT_METRICS = ('download_speed', 'upload_speed', 'latency')
+
+
+def _dump_json(data) -> bytes:
+    """Serialize a report or export to indented JSON, with orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, default=str).encode('utf-8')
+
 
 class StarlinkSimpleMonitor:
     """
@@ -52,11 +84,17 @@ class StarlinkSimpleMonitor:
         """
         self.host = host
         self.log_file = log_file
-        self.config = self._load_config(config_file)
+        self._log_listener = None
         
-        # Set up logging
+        # Set up logging first so config loading can report through it.
+        # Keyed on the log file too, so each monitor writes where it was told
+        self.log = logging.getLogger(
+            f"starlink_simple_monitor.{host}.{os.path.abspath(log_file)}"
+        )
         self._setup_logging()
         
+        self.config = self._load_config(config_file)
+        
         # Initialize Starlink client
         self.client = None
         self._initialize_client()
@@ -67,11 +105,16 @@ class StarlinkSimpleMonitor:
         self.max_packet_loss = self.config.get('max_packet_loss', 10)  # %
         self.check_interval = self.config.get('check_interval', 60)  # seconds
         self.max_issue_count = self.config.get('max_issue_count', 3)  # consecutive issues before action
+        # Optional faster follow-up checks for fast_check_window seconds after an issue
+        self.fast_check_interval = self.config.get('fast_check_interval')  # seconds, None = off
+        self.fast_check_window = self.config.get('fast_check_window', 60)  # seconds
         
         # Crisis mode settings
         self.crisis_mode = self.config.get('crisis_mode', False)
         self.enable_auto_recovery = self.config.get('enable_auto_recovery', True)
         self.notify_on_issues = self.config.get('notify_on_issues', True)
+        self.auto_reboot_on_persistent_issues = self.config.get('auto_reboot_on_persistent_issues', True)
+        self.webhook_url = self.config.get('webhook_url')
         
         # State tracking
         self.issue_count = 0
@@ -80,16 +123,33 @@ class StarlinkSimpleMonitor:
         self.last_reboot_time = None
         self.monitoring = False
         self.monitor_thread = None
+        # Set by stop_monitoring() to cut any interval or reboot wait short
+        self._stop_event = threading.Event()
+        self._fast_checks_until = 0.0  # time.monotonic() deadline
         
-        # Performance history
-        self.performance_history = []
+        # Performance history, oldest samples dropped once full
         self.max_history_size = 1000
+        self.performance_history = deque(maxlen=self.max_history_size)
+        
+        # With NumPy, a ring of (POSIX timestamp, *REPORT_METRICS) rows kept
+        # alongside the history so reports reduce columns instead of dicts
+        self._metric_rows = None
+        self._metric_next = 0
+        self._metric_filled = 0
+        if NUMPY_AVAILABLE:
+            self._metric_rows = np.empty(
+                (self.max_history_size, 1 + len(REPORT_METRICS)), dtype=np.float64
+            )
+        
+        # Alert history, oldest alerts dropped once full
+        self.alerts = deque(maxlen=self.config.get('max_alerts', 10000))
         
-        # Alert history
-        self.alerts = []
+        # Webhook delivery, created on first use and run off the check path
+        self._webhook_session = None
+        self._webhook_executor = None
         
-        logging.info(f"Starlink Simple Monitor initialized for {host}")
-        logging.info(f"Thresholds: Download>{self.min_download_speed}Mbps, Latency<{self.max_latency}ms")
+        self.log.info("Starlink Simple Monitor initialized for %s", host)
+        self.log.info("Thresholds: Download>%sMbps, Latency<%sms", self.min_download_speed, self.max_latency)
     
     def _load_config(self, config_file: Optional[str]) -> Dict:
         """Load configuration from JSON file"""
@@ -104,7 +164,10 @@ class StarlinkSimpleMonitor:
             'notify_on_issues': True,
             'auto_reboot_on_persistent_issues': True,
             'notify_email': None,
-            'webhook_url': None
+            'webhook_url': None,
+            'fast_check_interval': None,
+            'fast_check_window': 60,
+            'max_alerts': 10000
         }
         
         if config_file and os.path.exists(config_file):
@@ -113,38 +176,54 @@ class StarlinkSimpleMonitor:
                     user_config = json.load(f)
                 # Merge with defaults
                 default_config.update(user_config)
-                logging.info(f"Loaded configuration from {config_file}")
+                self.log.info("Loaded configuration from %s", config_file)
             except Exception as e:
-                logging.error(f"Failed to load config file: {e}")
+                self.log.error("Failed to load config file: %s", e)
         
         return default_config
     
     def _setup_logging(self):
-        """Setup logging to file and console"""
+        """Setup this monitor's logger, writing to its log file and console"""
+        # Monitors for the same host and log file share a logger (and one
+        # rotating handler on that file); the first one sets it up
+        if self.log.handlers:
+            return
+        
         # Create logs directory if it doesn't exist
-        log_dir = os.path.dirname(self.log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir, exist_ok=True)
-        
-        # Configure logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(self.log_file, encoding='utf-8'),
-                logging.StreamHandler(sys.stdout)
-            ]
-        )
+        Path(self.log_file).parent.mkdir(parents=True, exist_ok=True)
+        
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        handlers = [
+            logging.handlers.RotatingFileHandler(
+                self.log_file, maxBytes=10 * 1024 * 1024, backupCount=5, encoding='utf-8'
+            ),
+            logging.StreamHandler(sys.stdout),
+        ]
+        for handler in handlers:
+            handler.setFormatter(formatter)
+        
+        # Checks only enqueue records; a background thread does the writes.
+        # Stopped at exit rather than in stop_monitoring() so the final
+        # report messages logged after monitoring ends are still flushed.
+        log_queue = Queue(-1)
+        self._log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+        
+        self.log.addHandler(logging.handlers.QueueHandler(log_queue))
+        self.log.setLevel(logging.INFO)
+        # Output goes to this monitor's own handlers, not the root logger's
+        self.log.propagate = False
     
     def _initialize_client(self):
         """Initialize Starlink client connection"""
         try:
             self.client = StarlinkClient(host=self.host)
-            logging.info(f"Connected to Starlink router at {self.host}")
+            self.log.info("Connected to Starlink router at %s", self.host)
             return True
         except Exception as e:
-            logging.error(f"Failed to connect to Starlink: {e}")
-            logging.error("Ensure the Starlink router is reachable at the specified IP")
+            self.log.error("Failed to connect to Starlink: %s", e)
+            self.log.error("Ensure the Starlink router is reachable at the specified IP")
             return False
     
     def get_network_stats(self) -> Optional[Dict]:
@@ -156,14 +235,17 @@ class StarlinkSimpleMonitor:
             
             stats = self.client.get_network_stats()
             
-            # Convert to dictionary for easier handling
+            # Convert to dictionary for easier handling; 'ts' is the same
+            # moment as a POSIX timestamp, so reports need not parse 'timestamp'
+            now = datetime.now()
             stats_dict = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now.isoformat(),
+                'ts': now.timestamp(),
                 'download_speed': stats.download_speed,
-                'upload_speed': stats.upload_speed if hasattr(stats, 'upload_speed') else 0,
+                'upload_speed': getattr(stats, 'upload_speed', 0),
                 'latency': stats.latency,
-                'jitter': stats.jitter if hasattr(stats, 'jitter') else 0,
-                'packet_loss': stats.packet_loss if hasattr(stats, 'packet_loss') else 0
+                'jitter': getattr(stats, 'jitter', 0),
+                'packet_loss': getattr(stats, 'packet_loss', 0)
             }
             
             # Store in history
@@ -172,7 +254,7 @@ class StarlinkSimpleMonitor:
             return stats_dict
             
         except Exception as e:
-            logging.error(f"Error getting network stats: {e}")
+            self.log.error("Error getting network stats: %s", e)
             return None
     
     def get_telemetry_alerts(self) -> List[str]:
@@ -189,21 +271,24 @@ class StarlinkSimpleMonitor:
                     alert_str = f"{alert.type}: {alert.message}"
                     alerts.append(alert_str)
                     if self.notify_on_issues:
-                        logging.warning(f"Telemetry Alert: {alert_str}")
+                        self.log.warning("Telemetry Alert: %s", alert_str)
             
             return alerts
             
         except Exception as e:
-            logging.warning(f"Could not get telemetry: {e}")
+            self.log.warning("Could not get telemetry: %s", e)
             return []
     
     def _store_performance_data(self, stats: Dict):
         """Store performance data in history"""
         self.performance_history.append(stats)
         
-        # Trim history if too large
-        if len(self.performance_history) > self.max_history_size:
-            self.performance_history = self.performance_history[-self.max_history_size:]
+        if self._metric_rows is not None:
+            row = self._metric_rows[self._metric_next]
+            row[0] = stats['ts']
+            row[1:] = [stats[key] for key in REPORT_METRICS]
+            self._metric_next = (self._metric_next + 1) % self.max_history_size
+            self._metric_filled = min(self._metric_filled + 1, self.max_history_size)
     
     def check_connectivity_issues(self, stats: Dict) -> List[str]:
         """
@@ -240,9 +325,9 @@ class StarlinkSimpleMonitor:
         self.min_download_speed = min_download
         self.max_latency = max_latency
         
-        logging.warning(f"CRISIS MODE ENABLED")
-        logging.warning(f"Thresholds adjusted: Download>{min_download}Mbps (was {old_min}), Latency<{max_latency}ms (was {old_max})")
-        logging.warning("Auto-recovery enabled, relaxed thresholds for emergency connectivity")
+        self.log.warning("CRISIS MODE ENABLED")
+        self.log.warning("Thresholds adjusted: Download>%sMbps (was %s), Latency<%sms (was %s)", min_download, old_min, max_latency, old_max)
+        self.log.warning("Auto-recovery enabled, relaxed thresholds for emergency connectivity")
     
     def reboot_dish(self) -> bool:
         """Reboot the Starlink dish"""
@@ -250,22 +335,22 @@ class StarlinkSimpleMonitor:
             if self.last_reboot_time:
                 time_since_reboot = time.time() - self.last_reboot_time
                 if time_since_reboot < 300:  # 5 minutes
-                    logging.warning(f"Dish rebooted recently ({time_since_reboot:.0f}s ago). Skipping reboot.")
+                    self.log.warning("Dish rebooted recently (%.0fs ago). Skipping reboot.", time_since_reboot)
                     return False
             
-            logging.critical("REBOOTING STARLINK DISH")
+            self.log.critical("REBOOTING STARLINK DISH")
             
             # Check if reboot method is available
             if hasattr(self.client, 'reboot_dish'):
                 self.client.reboot_dish()
             else:
                 # Try alternative reboot method
-                logging.warning("reboot_dish method not available, trying alternative...")
+                self.log.warning("reboot_dish method not available, trying alternative...")
                 # In some versions, it might be reboot() instead
                 if hasattr(self.client, 'reboot'):
                     self.client.reboot()
                 else:
-                    logging.error("No reboot method found on StarlinkClient")
+                    self.log.error("No reboot method found on StarlinkClient")
                     return False
             
             self.last_reboot_time = time.time()
@@ -280,13 +365,13 @@ class StarlinkSimpleMonitor:
             }
             self.alerts.append(reboot_log)
             
-            logging.info("Dish reboot command sent successfully")
-            logging.info("Dish will be offline for approximately 5-10 minutes")
+            self.log.info("Dish reboot command sent successfully")
+            self.log.info("Dish will be offline for approximately 5-10 minutes")
             
             return True
             
         except Exception as e:
-            logging.error(f"Failed to reboot dish: {e}")
+            self.log.error("Failed to reboot dish: %s", e)
             return False
     
     def send_notification(self, message: str, issue_type: str = "warning"):
@@ -313,22 +398,37 @@ class StarlinkSimpleMonitor:
         
         # Log based on issue type
         if issue_type == "critical":
-            logging.critical(f"NOTIFICATION: {message}")
+            self.log.critical("NOTIFICATION: %s", message)
         elif issue_type == "warning":
-            logging.warning(f"NOTIFICATION: {message}")
+            self.log.warning("NOTIFICATION: %s", message)
         else:
-            logging.info(f"NOTIFICATION: {message}")
+            self.log.info("NOTIFICATION: %s", message)
         
         # In a real implementation, this could send email, SMS, or webhook
-        if self.config.get('webhook_url'):
+        if self.webhook_url:
             self._send_webhook_notification(notification)
     
     def _send_webhook_notification(self, notification: Dict):
-        """Send notification to webhook (placeholder for implementation)"""
-        # This would be implemented based on specific notification service
-        # Example: requests.post(self.config['webhook_url'], json=notification)
-        logging.debug(f"Webhook notification not configured. Notification: {notification['type']} - {notification['message']}")
-        pass
+        """Queue a notification for delivery to the configured webhook"""
+        if self._webhook_executor is None:
+            self._webhook_session = requests.Session()
+            # One worker keeps notifications in order without blocking checks
+            self._webhook_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="webhook"
+            )
+        self._webhook_executor.submit(
+            self._post_webhook_notification, self._webhook_session, notification
+        )
+    
+    def _post_webhook_notification(self, session: requests.Session, notification: Dict):
+        """POST a notification to the webhook, logging failures"""
+        try:
+            response = session.post(
+                self.webhook_url, json=notification, timeout=5
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.log.warning("Webhook notification failed: %s", e)
     
     def run_single_check(self) -> bool:
         """
@@ -342,7 +442,8 @@ class StarlinkSimpleMonitor:
         if not stats:
             self.issue_count += 1
             self.total_issues += 1
-            logging.error("Failed to get network statistics")
+            self._start_fast_checks()
+            self.log.error("Failed to get network statistics")
             
             if self.issue_count >= self.max_issue_count:
                 self.send_notification(
@@ -353,10 +454,9 @@ class StarlinkSimpleMonitor:
             return False
         
         # Log current stats
-        logging.info(
-            f"Download: {stats['download_speed']:.1f} Mbps, "
-            f"Upload: {stats['upload_speed']:.1f} Mbps, "
-            f"Latency: {stats['latency']:.1f} ms"
+        self.log.info(
+            "Download: %.1f Mbps, Upload: %.1f Mbps, Latency: %.1f ms",
+            stats['download_speed'], stats['upload_speed'], stats['latency']
         )
         
         # Check for issues
@@ -366,9 +466,10 @@ class StarlinkSimpleMonitor:
             self.issue_count += 1
             self.total_issues += 1
             self.consecutive_good_checks = 0
+            self._start_fast_checks()
             
             for issue in issues:
-                logging.warning(f"Issue detected: {issue}")
+                self.log.warning("Issue detected: %s", issue)
             
             # Send notification if enabled
             if self.notify_on_issues:
@@ -380,20 +481,18 @@ class StarlinkSimpleMonitor:
             
             # Check if we need to take action
             if self.issue_count >= self.max_issue_count and self.enable_auto_recovery:
-                logging.error(f"Persistent issues detected ({self.issue_count} consecutive). Taking action...")
+                self.log.error("Persistent issues detected (%s consecutive). Taking action...", self.issue_count)
                 
-                if self.config.get('auto_reboot_on_persistent_issues', True):
+                if self.auto_reboot_on_persistent_issues:
                     self.reboot_dish()
                     # Wait after reboot with ability to interrupt
                     wait_time = 300  # 5 minutes
-                    logging.info(f"Waiting {wait_time}s for dish to reboot and reconnect...")
-                    for _ in range(wait_time):
-                        if not self.monitoring:
-                            break
-                        time.sleep(1)
+                    if self.monitoring:
+                        self.log.info("Waiting %ss for dish to reboot and reconnect...", wait_time)
+                        self._stop_event.wait(wait_time)
                     self.issue_count = 0
                 else:
-                    logging.warning("Auto-reboot disabled. Manual intervention required.")
+                    self.log.warning("Auto-reboot disabled. Manual intervention required.")
             
             return False
         else:
@@ -402,17 +501,28 @@ class StarlinkSimpleMonitor:
             self.consecutive_good_checks += 1
             
             if self.consecutive_good_checks == 1:  # Just recovered
-                logging.info("Connectivity restored to normal")
+                self.log.info("Connectivity restored to normal")
                 if self.notify_on_issues:
                     self.send_notification("Connectivity restored to normal", "info")
             
             # Check telemetry alerts
             telemetry_alerts = self.get_telemetry_alerts()
             for alert in telemetry_alerts:
-                logging.warning(f"Telemetry Alert: {alert}")
+                self.log.warning("Telemetry Alert: %s", alert)
             
             return True
     
+    def _start_fast_checks(self):
+        """Check at fast_check_interval for the next fast_check_window seconds"""
+        if self.fast_check_interval:
+            self._fast_checks_until = time.monotonic() + self.fast_check_window
+    
+    def _next_check_delay(self) -> float:
+        """Seconds to wait before the next check"""
+        if self.fast_check_interval and time.monotonic() < self._fast_checks_until:
+            return min(self.fast_check_interval, self.check_interval)
+        return self.check_interval
+    
     def start_continuous_monitoring(self, interval: int = None):
         """
         Start continuous monitoring
@@ -424,18 +534,17 @@ class StarlinkSimpleMonitor:
             self.check_interval = interval
         
         self.monitoring = True
-        logging.info(f"Starting continuous monitoring (interval: {self.check_interval}s)")
+        self._stop_event.clear()
+        self.log.info("Starting continuous monitoring (interval: %ss)", self.check_interval)
         
         # Run in a separate thread
         def monitor_loop():
             while self.monitoring:
                 self.run_single_check()
                 
-                # Sleep for interval
-                for _ in range(self.check_interval):
-                    if not self.monitoring:
-                        break
-                    time.sleep(1)
+                # Sleep for interval, waking at once if stopped
+                if self._stop_event.wait(self._next_check_delay()):
+                    break
         
         self.monitor_thread = threading.Thread(target=monitor_loop, daemon=True)
         self.monitor_thread.start()
@@ -443,9 +552,17 @@ class StarlinkSimpleMonitor:
     def stop_monitoring(self):
         """Stop continuous monitoring"""
         self.monitoring = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
-        logging.info("Monitoring stopped")
+        # Queued notifications still go out, then the session is closed
+        # and the worker exits; the next notification starts new ones
+        if self._webhook_executor is not None:
+            self._webhook_executor.submit(self._webhook_session.close)
+            self._webhook_executor.shutdown(wait=False)
+            self._webhook_executor = None
+            self._webhook_session = None
+        self.log.info("Monitoring stopped")
     
     def get_performance_report(self, hours: int = 24) -> Dict:
         """
@@ -459,41 +576,25 @@ class StarlinkSimpleMonitor:
         """
         # Filter data from specified time period
         cutoff_time = datetime.now().timestamp() - (hours * 3600)
-        recent_data = [
-            d for d in self.performance_history
-            if datetime.fromisoformat(d['timestamp']).timestamp() > cutoff_time
-        ]
+        summary = self._summarize_since(cutoff_time)
         
-        if not recent_data:
+        if summary is None:
             return {'status': 'no_data', 'hours': hours}
         
-        # Calculate statistics
-        download_speeds = [d['download_speed'] for d in recent_data]
-        upload_speeds = [d['upload_speed'] for d in recent_data]
-        latencies = [d['latency'] for d in recent_data]
-        
         report = {
             'period_hours': hours,
-            'samples': len(recent_data),
+            'samples': summary['samples'],
             'timestamp': datetime.now().isoformat(),
-            'averages': {
-                'download_speed': sum(download_speeds) / len(download_speeds),
-                'upload_speed': sum(upload_speeds) / len(upload_speeds),
-                'latency': sum(latencies) / len(latencies),
-            },
-            'maximums': {
-                'download_speed': max(download_speeds),
-                'upload_speed': max(upload_speeds),
-                'latency': max(latencies),
-            },
-            'minimums': {
-                'download_speed': min(download_speeds),
-                'upload_speed': min(upload_speeds),
-                'latency': min(latencies),
-            },
+            'averages': summary['averages'],
+            'maximums': summary['maximums'],
+            'minimums': summary['minimums'],
             'issues': {
                 'total_issues': self.total_issues,
-                'recent_alerts': len([a for a in self.alerts[-10:] if a['type'] in ['warning', 'critical']]),
+                # Reboot log entries carry an 'action' rather than a 'type'
+                'recent_alerts': sum(
+                    1 for a in islice(reversed(self.alerts), 10)
+                    if a.get('type') in ('warning', 'critical')
+                ),
                 'last_reboot': self.last_reboot_time
             },
             'current_thresholds': {
@@ -506,17 +607,50 @@ class StarlinkSimpleMonitor:
         
         return report
     
+    def _summarize_since(self, cutoff_time: float) -> Optional[Dict]:
+        """
+        Sample count and average/maximum/minimum of each report metric
+        for samples newer than cutoff_time, or None if there are none
+        """
+        if self._metric_rows is not None:
+            rows = self._metric_rows[:self._metric_filled]
+            window = rows[rows[:, 0] > cutoff_time, 1:]
+            if not len(window):
+                return None
+            return {
+                'samples': len(window),
+                'averages': dict(zip(REPORT_METRICS, window.mean(axis=0).tolist())),
+                'maximums': dict(zip(REPORT_METRICS, window.max(axis=0).tolist())),
+                'minimums': dict(zip(REPORT_METRICS, window.min(axis=0).tolist())),
+            }
+        
+        # Samples are appended in time order, so walk back from the newest
+        # and stop at the first one outside the window
+        recent_data = list(takewhile(
+            lambda d: d['ts'] > cutoff_time, reversed(self.performance_history)
+        ))
+        if not recent_data:
+            return None
+        
+        columns = {key: [d[key] for d in recent_data] for key in REPORT_METRICS}
+        return {
+            'samples': len(recent_data),
+            'averages': {key: sum(col) / len(col) for key, col in columns.items()},
+            'maximums': {key: max(col) for key, col in columns.items()},
+            'minimums': {key: min(col) for key, col in columns.items()},
+        }
+    
     def save_report(self, filename: str = "starlink_report.json", hours: int = 24):
         """Save performance report to JSON file"""
         report = self.get_performance_report(hours=hours)
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
-            logging.info(f"Report saved to {filename}")
+            with open(filename, 'wb') as f:
+                f.write(_dump_json(report))
+            self.log.info("Report saved to %s", filename)
             return True
         except Exception as e:
-            logging.error(f"Failed to save report: {e}")
+            self.log.error("Failed to save report: %s", e)
             return False
     
     def export_logs(self, filename: str = "starlink_logs_export.json"):
@@ -524,8 +658,11 @@ class StarlinkSimpleMonitor:
         export_data = {
             'export_timestamp': datetime.now().isoformat(),
             'monitor_config': self.config,
-            'performance_history': self.performance_history[-100:],  # Last 100 entries
-            'alerts': self.alerts,
+            # Last 100 entries
+            'performance_history': list(islice(
+                self.performance_history, max(0, len(self.performance_history) - 100), None
+            )),
+            'alerts': list(self.alerts),
             'summary': {
                 'total_issues': self.total_issues,
                 'crisis_mode': self.crisis_mode,
@@ -535,17 +672,18 @@ class StarlinkSimpleMonitor:
         }
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
-            logging.info(f"Logs exported to {filename}")
+            with open(filename, 'wb') as f:
+                f.write(_dump_json(export_data))
+            self.log.info("Logs exported to %s", filename)
             return True
         except Exception as e:
-            logging.error(f"Failed to export logs: {e}")
+            self.log.error("Failed to export logs: %s", e)
             return False
 
 
-def main():
-    """Main function for command-line execution"""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; parse_args() does not modify it."""
     parser = argparse.ArgumentParser(
         description="Starlink Connectivity Monitor for Crisis Scenarios",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -645,7 +783,12 @@ Inspired by connectivity challenges in Venezuela and other crisis scenarios.
         help='Export logs to JSON file and exit'
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main function for command-line execution"""
+    args = _build_parser().parse_args()
     
     # Initialize monitor
     monitor = StarlinkSimpleMonitor(